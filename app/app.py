@@ -8,6 +8,7 @@ from app.components.flashcards import flashcards_view
 from app.components.grammar import grammar_practice_view
 from app.components.dashboard import progress_dashboard_view
 from app.components.word_lookup import word_lookup_view
+from app.utils.db_helper import lookup_lifespan
 
 
 def main_content() -> rx.Component:
@@ -70,4 +71,5 @@ app = rx.App(
         ),
     ],
 )
-app.add_page(index, on_load=TranslationState.on_load)
\ No newline at end of file
+app.add_page(index, on_load=TranslationState.on_load)
+app.register_lifespan_task(lookup_lifespan)
\ No newline at end of file
@@ -6,15 +6,17 @@ def word_lookup_view() -> rx.Component:
     return rx.el.div(
         rx.el.h2("Word Lookup", class_name="text-3xl font-bold text-gray-800 mb-6"),
         rx.el.p(
-            "Look up conjugations for verbs or declensions for nouns. Data is fetched live from Wiktionary.",
+            "Look up conjugations for verbs or declensions for nouns, or type an English word to find its Finnish translations.",
             class_name="text-center text-gray-600 mb-8 max-w-2xl mx-auto",
         ),
         rx.el.form(
             rx.el.div(
                 rx.el.input(
                     name="query",
-                    placeholder="E.g., 'puhua', 'talo', 'kissa'...",
+                    placeholder="E.g., 'puhua', 'talo', 'kissa' or 'to speak'...",
                     default_value=TranslationState.word_search_query,
+                    auto_complete="off",
+                    on_change=TranslationState.suggest_words.debounce(200),
                     class_name="w-full p-4 text-lg border-2 border-gray-300 rounded-lg focus:ring-2 focus:ring-violet-500 focus:border-violet-500 transition-colors",
                 ),
                 rx.el.button(
@@ -27,6 +29,10 @@ def word_lookup_view() -> rx.Component:
                     disabled=TranslationState.is_searching_word,
                     class_name="absolute right-3 top-1/2 -translate-y-1/2 p-2 bg-violet-600 text-white rounded-md hover:bg-violet-700 disabled:bg-violet-300",
                 ),
+                rx.cond(
+                    TranslationState.word_suggestions.length() > 0,
+                    word_suggestions_list(),
+                ),
                 class_name="relative w-full max-w-md mx-auto",
             ),
             on_submit=lambda form_data: TranslationState.search_word(
@@ -35,11 +41,19 @@ def word_lookup_view() -> rx.Component:
             class_name="mb-8",
         ),
         rx.el.div(
+            rx.cond(
+                TranslationState.resolved_forms.length() > 0,
+                resolved_forms_banner(),
+            ),
             rx.match(
                 TranslationState.searched_word_result["type"],
                 ("verb", conjugation_table(TranslationState.searched_word_result)),
                 ("noun", declension_table(TranslationState.searched_word_result)),
-                no_results_found(),
+                rx.cond(
+                    TranslationState.translation_matches.length() > 0,
+                    translation_matches_list(),
+                    no_results_found(),
+                ),
             ),
             class_name="max-w-4xl mx-auto",
         ),
@@ -238,4 +252,91 @@ def no_results_found() -> rx.Component:
                 ),
             ),
         )
+    )
+
+
+def translation_matches_list() -> rx.Component:
+    return rx.el.div(
+        rx.el.h3(
+            f'Finnish words for "{TranslationState.word_search_query}"',
+            class_name="text-xl font-semibold text-gray-700 mb-4",
+        ),
+        rx.el.ul(
+            rx.foreach(
+                TranslationState.translation_matches,
+                lambda match: rx.el.li(
+                    rx.el.button(
+                        rx.el.span(
+                            match["word"], class_name="font-bold text-violet-700"
+                        ),
+                        rx.el.span(
+                            match["pos"],
+                            class_name="px-2 py-0.5 bg-gray-100 text-gray-600 text-xs rounded-full",
+                        ),
+                        rx.el.span(
+                            match["translation"], class_name="text-gray-600 truncate"
+                        ),
+                        on_click=TranslationState.search_word(match["word"]),
+                        class_name="w-full flex items-center gap-3 p-3 text-left hover:bg-gray-50",
+                    ),
+                    class_name="border-b border-gray-200 last:border-b-0",
+                ),
+            ),
+            class_name="bg-white rounded-lg shadow-sm border",
+        ),
+        rx.cond(
+            TranslationState.has_more_translation_matches,
+            rx.el.button(
+                "Show more",
+                on_click=TranslationState.load_more_translation_matches,
+                class_name="mt-4 py-2 px-4 bg-violet-600 text-white font-semibold rounded-lg hover:bg-violet-700",
+            ),
+        ),
+    )
+
+
+def resolved_forms_banner() -> rx.Component:
+    return rx.el.div(
+        rx.el.p(
+            f'"{TranslationState.word_search_query}" is a form of:',
+            class_name="text-gray-600 mb-2",
+        ),
+        rx.el.div(
+            rx.foreach(
+                TranslationState.resolved_forms,
+                lambda analysis: rx.el.button(
+                    rx.el.span(analysis["word"], class_name="font-bold"),
+                    rx.el.span(
+                        analysis["tags"].join(" "), class_name="text-xs text-gray-500"
+                    ),
+                    on_click=TranslationState.search_word(analysis["word"]),
+                    class_name="flex items-center gap-2 px-3 py-1 bg-violet-50 text-violet-700 rounded-full hover:bg-violet-100",
+                ),
+            ),
+            class_name="flex flex-wrap gap-2",
+        ),
+        class_name="mb-6 p-4 bg-white rounded-lg shadow-sm border",
+    )
+
+
+def word_suggestions_list() -> rx.Component:
+    return rx.el.ul(
+        rx.foreach(
+            TranslationState.word_suggestions,
+            lambda suggestion: rx.el.li(
+                rx.el.button(
+                    rx.el.span(suggestion["text"], class_name="font-medium"),
+                    rx.cond(
+                        suggestion["text"] != suggestion["word"],
+                        rx.el.span(
+                            suggestion["word"], class_name="text-sm text-gray-500"
+                        ),
+                    ),
+                    type="button",
+                    on_click=TranslationState.search_word(suggestion["text"]),
+                    class_name="w-full flex items-center justify-between gap-3 px-4 py-2 text-left hover:bg-violet-50",
+                ),
+            ),
+        ),
+        class_name="absolute left-0 right-0 top-full mt-1 z-10 bg-white border rounded-lg shadow-lg overflow-hidden",
     )
\ No newline at end of file
@@ -9,6 +9,7 @@ FINNISH_WORDS_URL = (
     "https://raw.githubusercontent.com/Trimpsuz/finnish-words/main/words.txt"
 )
 WORD_CACHE_FILE = ".web/word_cache.json"
+TRANSLATION_MATCHES_PAGE_SIZE = 10
 
 
 class Sentence(TypedDict):
@@ -53,6 +54,23 @@ class Noun(TypedDict):
     declensions: dict[str, dict[str, str]]
 
 
+class TranslationMatch(TypedDict):
+    word: str
+    pos: str
+    translation: str
+
+
+class FormAnalysis(TypedDict):
+    word: str
+    pos: str
+    tags: list[str]
+
+
+class Completion(TypedDict):
+    text: str
+    word: str
+
+
 WiktionaryResult = Verb | Noun
 LearningMode = Literal[
     "Translation Practice",
@@ -277,6 +295,11 @@ class TranslationState(rx.State):
     word_search_query: str = ""
     word_database: list[WiktionaryResult] = []
     searched_word_result: Optional[WiktionaryResult] = None
+    translation_matches: list[TranslationMatch] = []
+    resolved_forms: list[FormAnalysis] = []
+    word_suggestions: list[Completion] = []
+    word_suggestion_prefix: str = ""
+    has_more_translation_matches: bool = False
 
     @rx.var
     def current_sentence(self) -> Sentence:
@@ -390,6 +413,8 @@ class TranslationState(rx.State):
         self.vocab_card_flipped = False
         self.show_grammar_feedback = False
         self.word_search_query = ""
+        self.translation_matches = []
+        self.resolved_forms = []
 
     @rx.event
     def submit_translation(self):
@@ -480,11 +505,29 @@ class TranslationState(rx.State):
             self.grammar_exercises
         )
 
+    @rx.event(background=True)
+    async def suggest_words(self, prefix: str):
+        """Typeahead for Word Lookup; the input debounces the calls."""
+        prefix = prefix.strip().lower()
+        async with self:
+            self.word_suggestion_prefix = prefix
+        from app.utils.db_helper import complete_word_async
+
+        suggestions = await complete_word_async(prefix) if prefix else []
+        async with self:
+            # A later keystroke may have been answered first.
+            if self.word_suggestion_prefix == prefix:
+                self.word_suggestions = suggestions
+
     @rx.event
     def search_word(self, query: str):
+        self.word_suggestions = []
+        self.word_suggestion_prefix = ""
         self.word_search_query = query.strip().lower()
         if not self.word_search_query:
             self.searched_word_result = None
+            self.translation_matches = []
+            self.resolved_forms = []
             return
         return TranslationState.lookup_word_from_db
 
@@ -553,22 +596,74 @@ class TranslationState(rx.State):
                 return
             self.is_searching_word = True
             self.searched_word_result = None
+            self.translation_matches = []
+            self.resolved_forms = []
         yield
-        from app.utils.db_helper import get_word_details
+        from app.utils.db_helper import (
+            get_word_details_async,
+            resolve_form_async,
+            search_by_translation_async,
+        )
 
-        word_data = get_word_details(self.word_search_query)
+        word_data = await get_word_details_async(self.word_search_query)
+        analyses = []
+        if not word_data:
+            # An inflected form: show the first lemma it resolves to.
+            analyses = await resolve_form_async(self.word_search_query)
+            if analyses:
+                word_data = await get_word_details_async(analyses[0]["word"])
+        matches = []
+        if not word_data:
+            # Not a Finnish word: treat the query as English.
+            matches = await search_by_translation_async(
+                self.word_search_query, limit=TRANSLATION_MATCHES_PAGE_SIZE + 1
+            )
         async with self:
             self.is_searching_word = False
-            if word_data:
+            self.resolved_forms = analyses
+            self.translation_matches = matches[:TRANSLATION_MATCHES_PAGE_SIZE]
+            self.has_more_translation_matches = (
+                len(matches) > TRANSLATION_MATCHES_PAGE_SIZE
+            )
+            if word_data and analyses:
+                self.searched_word_result = word_data
+                yield rx.toast.success(
+                    f'"{self.word_search_query}" is a form of "{analyses[0]["word"]}".'
+                )
+            elif word_data:
                 self.searched_word_result = word_data
                 yield rx.toast.success(
                     f'Successfully looked up "{self.word_search_query}" from local DB!'
                 )
+            elif matches:
+                yield rx.toast.info(
+                    f'Showing Finnish words for "{self.word_search_query}".'
+                )
             else:
                 yield rx.toast.error(
                     f'Could not find "{self.word_search_query}" in the local dictionary. Check spelling or import the dictionary first.'
                 )
 
+    @rx.event(background=True)
+    async def load_more_translation_matches(self):
+        async with self:
+            query = self.word_search_query
+            offset = len(self.translation_matches)
+        from app.utils.db_helper import search_by_translation_async
+
+        matches = await search_by_translation_async(
+            query, limit=TRANSLATION_MATCHES_PAGE_SIZE + 1, offset=offset
+        )
+        async with self:
+            if query != self.word_search_query:
+                return
+            self.translation_matches = (
+                self.translation_matches + matches[:TRANSLATION_MATCHES_PAGE_SIZE]
+            )
+            self.has_more_translation_matches = (
+                len(matches) > TRANSLATION_MATCHES_PAGE_SIZE
+            )
+
     @rx.event(background=True)
     async def load_word_list(self):
         async with self:
@@ -0,0 +1,112 @@
+"""Transparent compression for archived Kaikki dumps.
+
+Inputs are recognised by their magic bytes rather than their file name, so a
+``.jsonl`` that is really gzip still works. gzip and xz use the standard
+library; zstd needs the optional ``zstandard`` package.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+READ_BUFFER_SIZE = 1024 * 1024
+
+MAGIC_BYTES = {
+    "gz": b"\x1f\x8b",
+    "xz": b"\xfd7zXZ\x00",
+    "zst": b"\x28\xb5\x2f\xfd",
+}
+SUFFIXES = {f".{name}": name for name in MAGIC_BYTES}
+
+
+def detect_compression(path: Path) -> Optional[str]:
+    """Return ``"gz"``, ``"xz"``, ``"zst"`` or ``None`` for plain files."""
+
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for name, magic in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise RuntimeError(
+            "Reading or writing .zst dumps requires the 'zstandard' package"
+        )
+
+
+class CompressedInput(io.BufferedReader):
+    """Buffered, decompressed view of a possibly compressed file.
+
+    ``raw_position`` is the offset reached in the file on disk, which is what
+    progress should be measured against; ``tell``/``seek`` work in
+    decompressed bytes so checkpoints stay valid whatever the format.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.file = open(path, "rb", buffering=0)
+        self.compression = detect_compression(path)
+        if self.compression == "gz":
+            stream = gzip.GzipFile(fileobj=self.file, mode="rb")
+        elif self.compression == "xz":
+            stream = lzma.LZMAFile(self.file, mode="rb")
+        elif self.compression == "zst":
+            _require_zstandard()
+            stream = zstandard.ZstdDecompressor().stream_reader(
+                self.file, read_across_frames=True
+            )
+        else:
+            stream = self.file
+        super().__init__(stream, buffer_size=READ_BUFFER_SIZE)
+
+    @property
+    def raw_position(self) -> int:
+        return self.file.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self.compression != "zst" or whence != io.SEEK_SET:
+            return super().seek(offset, whence)
+        # zstd readers are not seekable; skip forward by decompressing.
+        remaining = offset - self.tell()
+        if remaining < 0:
+            raise io.UnsupportedOperation("zstd input can only seek forward")
+        while remaining > 0:
+            chunk = self.read(min(remaining, READ_BUFFER_SIZE))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+        return self.tell()
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+
+def open_input(path: Path) -> CompressedInput:
+    return CompressedInput(Path(path))
+
+
+def open_output(path: Path, compression: Optional[str] = None) -> BinaryIO:
+    """Open ``path`` for writing, compressing by ``compression`` or its suffix."""
+
+    path = Path(path)
+    compression = compression or SUFFIXES.get(path.suffix)
+    if compression == "gz":
+        return gzip.open(path, "wb")
+    if compression == "xz":
+        return lzma.open(path, "wb")
+    if compression == "zst":
+        _require_zstandard()
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+    return open(path, "wb")
@@ -15,19 +15,97 @@ core information requested by the user:
 * additional sense-level metadata such as synonyms, antonyms, examples, etc.
 
 The script streams the input file to keep memory usage low and can optionally
-limit the number of processed entries for testing.
+limit the number of processed entries for testing. Run it as a module from the
+repository root::
+
+    python -m app.utils.convert_fi_jsonl_to_sqlite fi.jsonl fi_words.sqlite
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import multiprocessing
 import sqlite3
+from collections import deque
 from pathlib import Path
-from typing import Any, Iterable, Iterator, Optional
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from app.utils.compression import open_input
+from app.utils.db_finalize import finalize_database
+from app.utils.import_checkpoint import (
+    Checkpoint,
+    ensure_checkpoint_table,
+    load_checkpoint,
+    save_checkpoint,
+)
+from app.utils.import_progress import (
+    ProgressCallback,
+    ProgressTracker,
+    print_progress,
+)
+from app.utils.jsonl_prefilter import (
+    LineFilter,
+    make_line_filter,
+    verify_line_filter,
+)
 
 
 TARGET_PARTS_OF_SPEECH = {"noun", "verb"}
+DEFAULT_CHUNK_SIZE = 500
+LINE_FILTER = make_line_filter(TARGET_PARTS_OF_SPEECH)
+
+# Tags with an id below this are stored as bits of ``forms.tags_mask``; the
+# rest go to ``form_extra_tags``. The common inflection tags are registered
+# first so they always get a bit. A form whose tags are not simply sorted by
+# name and distinct also keeps their ids in order in ``forms.tag_order``.
+TAG_MASK_BITS = 63
+COMMON_FORM_TAGS = [
+    "singular",
+    "plural",
+    "nominative",
+    "genitive",
+    "partitive",
+    "accusative",
+    "inessive",
+    "elative",
+    "illative",
+    "adessive",
+    "ablative",
+    "allative",
+    "essive",
+    "translative",
+    "instructive",
+    "abessive",
+    "comitative",
+    "first-person",
+    "second-person",
+    "third-person",
+    "impersonal",
+    "present",
+    "past",
+    "perfect",
+    "pluperfect",
+    "indicative",
+    "conditional",
+    "imperative",
+    "potential",
+    "optative",
+    "negative",
+    "active",
+    "passive",
+    "infinitive",
+    "participle",
+    "agent",
+    "connegative",
+    "possessive",
+    "comparative",
+    "superlative",
+    "long",
+    "table-tags",
+    "inflection-template",
+]
 
 
 def parse_args() -> argparse.Namespace:
@@ -37,7 +115,7 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         nargs="?",
         default=Path("fi.jsonl"),
-        help="Path to the source fi.jsonl file.",
+        help="Path to the source fi.jsonl file (optionally gzip, xz or zstd compressed).",
     )
     parser.add_argument(
         "output_path",
@@ -52,38 +130,119 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Limit the number of lemma entries processed (useful for testing).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parser processes. The output is identical for any value.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of input lines handed to a parser process at a time.",
+    )
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Decode every line instead of skipping non-noun/verb lines by their raw bytes.",
+    )
+    parser.add_argument(
+        "--verify-prefilter",
+        type=int,
+        default=None,
+        metavar="SAMPLE",
+        help="Check the byte pre-filter against a full decode of the first SAMPLE lines before importing.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its last committed checkpoint instead of recreating the database.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print progress while importing.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Update an existing database in place: re-insert only entries whose content changed and delete entries missing from the input. A missing database is built from scratch.",
+    )
+    parser.add_argument(
+        "--verify-json",
+        type=int,
+        default=0,
+        metavar="SAMPLE",
+        help="After importing, check that the stored sense JSON and form tags of the first SAMPLE entries match the source.",
+    )
+    parser.add_argument(
+        "--finalize",
+        action="store_true",
+        help="Analyze and compact the database into a read-only artifact afterwards.",
+    )
     return parser.parse_args()
 
 
 def init_database(connection: sqlite3.Connection) -> None:
-    """Initialise schema required for the lexical data."""
-
-    drop_statements = [
-        "DROP TABLE IF EXISTS antonyms",
-        "DROP TABLE IF EXISTS synonyms",
-        "DROP TABLE IF EXISTS related_terms",
-        "DROP TABLE IF EXISTS derived_terms",
-        "DROP TABLE IF EXISTS forms",
-        "DROP TABLE IF EXISTS senses",
-        "DROP TABLE IF EXISTS entries",
+    """Initialise schema required for the lexical data.
+
+    Glosses, translations and terms repeat across entries, so they are stored
+    once in ``strings`` and referenced by id from the ``*_base`` tables. Views
+    named after the original tables join them back, keeping today's column
+    names for readers.
+    """
+
+    drop_order = [
+        "forms_with_tags",
+        "import_checkpoint",
+        "form_extra_tags",
+        "tags",
+        "antonyms",
+        "synonyms",
+        "related_terms",
+        "derived_terms",
+        "forms",
+        "senses",
+        "entries",
+        "antonyms_base",
+        "synonyms_base",
+        "related_terms_base",
+        "derived_terms_base",
+        "senses_base",
+        "entries_base",
+        "strings",
     ]
+    existing = dict(
+        connection.execute(
+            "SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view')"
+        )
+    )
 
     create_statements = [
         """
-        CREATE TABLE entries (
+        CREATE TABLE strings (
+            id INTEGER PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE entries_base (
             id INTEGER PRIMARY KEY,
             word TEXT NOT NULL,
             pos TEXT NOT NULL,
-            primary_translation TEXT,
-            etymology TEXT
+            primary_translation_id INTEGER REFERENCES strings(id),
+            etymology TEXT,
+            entry_key TEXT,
+            content_hash TEXT
         )
         """,
         """
-        CREATE TABLE senses (
+        CREATE TABLE senses_base (
             id INTEGER PRIMARY KEY,
-            entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+            entry_id INTEGER NOT NULL REFERENCES entries_base(id) ON DELETE CASCADE,
             sense_identifier TEXT,
-            gloss TEXT,
+            gloss_id INTEGER REFERENCES strings(id),
             glosses_json TEXT,
             raw_glosses_json TEXT,
             tags_json TEXT,
@@ -97,68 +256,207 @@ def init_database(connection: sqlite3.Connection) -> None:
         """
         CREATE TABLE forms (
             id INTEGER PRIMARY KEY,
-            entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+            entry_id INTEGER NOT NULL REFERENCES entries_base(id) ON DELETE CASCADE,
             form TEXT NOT NULL,
-            tags_json TEXT,
+            tags_mask INTEGER NOT NULL DEFAULT 0,
+            tag_order TEXT,
             source TEXT
         )
         """,
         """
-        CREATE TABLE derived_terms (
+        CREATE TABLE tags (
             id INTEGER PRIMARY KEY,
-            entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
-            term TEXT NOT NULL,
+            name TEXT NOT NULL UNIQUE
+        )
+        """,
+        """
+        CREATE TABLE form_extra_tags (
+            form_id INTEGER NOT NULL REFERENCES forms(id) ON DELETE CASCADE,
+            tag_id INTEGER NOT NULL REFERENCES tags(id),
+            PRIMARY KEY (form_id, tag_id)
+        ) WITHOUT ROWID
+        """,
+        f"""
+        CREATE VIEW forms_with_tags AS
+        SELECT
+            forms.id,
+            forms.entry_id,
+            forms.form,
+            CASE WHEN forms.tag_order IS NULL THEN (
+                SELECT NULLIF(json_group_array(name), '[]')
+                FROM (
+                    SELECT tags.name
+                    FROM tags
+                    WHERE (
+                        tags.id < {TAG_MASK_BITS}
+                        AND forms.tags_mask & (1 << tags.id)
+                    )
+                    OR tags.id IN (
+                        SELECT tag_id FROM form_extra_tags
+                        WHERE form_extra_tags.form_id = forms.id
+                    )
+                    ORDER BY tags.name
+                )
+            ) ELSE (
+                SELECT json_group_array(name)
+                FROM (
+                    SELECT tags.name
+                    FROM json_each(forms.tag_order) AS position
+                    JOIN tags ON tags.id = position.value
+                    ORDER BY position.key
+                )
+            ) END AS tags_json,
+            forms.source
+        FROM forms
+        """,
+        """
+        CREATE TABLE derived_terms_base (
+            id INTEGER PRIMARY KEY,
+            entry_id INTEGER NOT NULL REFERENCES entries_base(id) ON DELETE CASCADE,
+            term_id INTEGER NOT NULL REFERENCES strings(id),
             source_sense_identifier TEXT,
             extra_json TEXT
         )
         """,
         """
-        CREATE TABLE related_terms (
+        CREATE TABLE related_terms_base (
             id INTEGER PRIMARY KEY,
-            entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
-            term TEXT NOT NULL,
+            entry_id INTEGER NOT NULL REFERENCES entries_base(id) ON DELETE CASCADE,
+            term_id INTEGER NOT NULL REFERENCES strings(id),
             source_sense_identifier TEXT,
             tags_json TEXT,
             extra_json TEXT
         )
         """,
         """
-        CREATE TABLE synonyms (
+        CREATE TABLE synonyms_base (
             id INTEGER PRIMARY KEY,
-            sense_id INTEGER NOT NULL REFERENCES senses(id) ON DELETE CASCADE,
-            term TEXT NOT NULL,
+            sense_id INTEGER NOT NULL REFERENCES senses_base(id) ON DELETE CASCADE,
+            term_id INTEGER NOT NULL REFERENCES strings(id),
             tags_json TEXT,
             extra_json TEXT
         )
         """,
         """
-        CREATE TABLE antonyms (
+        CREATE TABLE antonyms_base (
             id INTEGER PRIMARY KEY,
-            sense_id INTEGER NOT NULL REFERENCES senses(id) ON DELETE CASCADE,
-            term TEXT NOT NULL,
+            sense_id INTEGER NOT NULL REFERENCES senses_base(id) ON DELETE CASCADE,
+            term_id INTEGER NOT NULL REFERENCES strings(id),
             tags_json TEXT,
             extra_json TEXT
         )
         """,
-        "CREATE INDEX idx_entries_word ON entries(word)",
-        "CREATE INDEX idx_entries_pos ON entries(pos)",
-        "CREATE INDEX idx_senses_entry ON senses(entry_id)",
+        """
+        CREATE VIEW entries AS
+        SELECT
+            entries_base.id,
+            entries_base.word,
+            entries_base.pos,
+            strings.value AS primary_translation,
+            entries_base.etymology,
+            entries_base.entry_key,
+            entries_base.content_hash
+        FROM entries_base
+        LEFT JOIN strings ON strings.id = entries_base.primary_translation_id
+        """,
+        """
+        CREATE VIEW senses AS
+        SELECT
+            senses_base.id,
+            senses_base.entry_id,
+            senses_base.sense_identifier,
+            strings.value AS gloss,
+            senses_base.glosses_json,
+            senses_base.raw_glosses_json,
+            senses_base.tags_json,
+            senses_base.topics_json,
+            senses_base.links_json,
+            senses_base.categories_json,
+            senses_base.examples_json,
+            senses_base.form_of_json
+        FROM senses_base
+        LEFT JOIN strings ON strings.id = senses_base.gloss_id
+        """,
+        """
+        CREATE VIEW derived_terms AS
+        SELECT
+            derived_terms_base.id,
+            derived_terms_base.entry_id,
+            strings.value AS term,
+            derived_terms_base.source_sense_identifier,
+            derived_terms_base.extra_json
+        FROM derived_terms_base
+        JOIN strings ON strings.id = derived_terms_base.term_id
+        """,
+        """
+        CREATE VIEW related_terms AS
+        SELECT
+            related_terms_base.id,
+            related_terms_base.entry_id,
+            strings.value AS term,
+            related_terms_base.source_sense_identifier,
+            related_terms_base.tags_json,
+            related_terms_base.extra_json
+        FROM related_terms_base
+        JOIN strings ON strings.id = related_terms_base.term_id
+        """,
+        """
+        CREATE VIEW synonyms AS
+        SELECT
+            synonyms_base.id,
+            synonyms_base.sense_id,
+            strings.value AS term,
+            synonyms_base.tags_json,
+            synonyms_base.extra_json
+        FROM synonyms_base
+        JOIN strings ON strings.id = synonyms_base.term_id
+        """,
+        """
+        CREATE VIEW antonyms AS
+        SELECT
+            antonyms_base.id,
+            antonyms_base.sense_id,
+            strings.value AS term,
+            antonyms_base.tags_json,
+            antonyms_base.extra_json
+        FROM antonyms_base
+        JOIN strings ON strings.id = antonyms_base.term_id
+        """,
+        "CREATE INDEX idx_entries_word ON entries_base(word)",
+        "CREATE INDEX idx_entries_pos ON entries_base(pos)",
+        "CREATE INDEX idx_entries_key ON entries_base(entry_key)",
+        "CREATE INDEX idx_senses_entry ON senses_base(entry_id)",
         "CREATE INDEX idx_forms_entry ON forms(entry_id)",
-        "CREATE INDEX idx_derived_entry ON derived_terms(entry_id)",
-        "CREATE INDEX idx_related_entry ON related_terms(entry_id)",
+        "CREATE INDEX idx_form_extra_tags_tag ON form_extra_tags(tag_id)",
+        "CREATE INDEX idx_derived_entry ON derived_terms_base(entry_id)",
+        "CREATE INDEX idx_related_entry ON related_terms_base(entry_id)",
+        "CREATE INDEX idx_synonyms_sense ON synonyms_base(sense_id)",
+        "CREATE INDEX idx_antonyms_sense ON antonyms_base(sense_id)",
     ]
 
     with connection:
-        for statement in drop_statements:
-            connection.execute(statement)
+        # Databases from before the string pool have tables where the views
+        # now are, so drop each object by its actual type.
+        for name in drop_order:
+            if name in existing:
+                connection.execute(f"DROP {existing[name].upper()} {name}")
         for statement in create_statements:
             connection.execute(statement)
+        connection.executemany(
+            "INSERT INTO tags (id, name) VALUES (?, ?)", enumerate(COMMON_FORM_TAGS)
+        )
+        ensure_checkpoint_table(connection)
+
+
+# ``json.dumps`` with non-default options builds a new encoder on every call,
+# which costs as much as encoding the small payloads stored per sense.
+encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 
 
 def json_or_none(payload: Any) -> Optional[str]:
     if not payload:
         return None
-    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return encode_json(payload)
 
 
 def normalise_term(candidate: Any) -> Optional[str]:
@@ -172,103 +470,791 @@ def normalise_term(candidate: Any) -> Optional[str]:
     return None
 
 
-def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as stream:
+def content_hash(line: bytes) -> str:
+    return hashlib.blake2b(line, digest_size=16).hexdigest()
+
+
+def entry_key(entry: dict[str, Any]) -> str:
+    """Identify a lemma entry across snapshots by word, pos and etymology index."""
+
+    return "{word}|{pos}|{etymology}".format(
+        word=entry.get("word"),
+        pos=entry.get("pos"),
+        etymology=entry.get("etymology_number") or "",
+    )
+
+
+def is_target_entry(entry: dict[str, Any]) -> bool:
+    return entry.get("pos") in TARGET_PARTS_OF_SPEECH
+
+
+def iter_jsonl(
+    path: Path,
+    line_filter: Optional[LineFilter] = None,
+) -> Iterator[dict[str, Any]]:
+    with open_input(path) as stream:
         for line_number, line in enumerate(stream, start=1):
             line = line.strip()
             if not line:
                 continue
+            if line_filter is not None and not line_filter(line):
+                continue
             try:
                 yield json.loads(line)
             except json.JSONDecodeError as exc:  # pragma: no cover - defensive
                 raise ValueError(f"Invalid JSON on line {line_number}: {exc}") from exc
 
 
+class SenseRows(NamedTuple):
+    """Insert-ready rows for one sense, without database ids."""
+
+    values: tuple[Any, ...]
+    derived: list[tuple[Any, ...]]
+    related: list[tuple[Any, ...]]
+    synonyms: list[tuple[Any, ...]]
+    antonyms: list[tuple[Any, ...]]
+
+
+class EntryRows(NamedTuple):
+    """Insert-ready rows for one lemma entry, without database ids.
+
+    Workers build these from raw lines; the writer assigns ids in input order
+    so the output database does not depend on the number of workers.
+    """
+
+    values: tuple[Any, ...]
+    senses: list[SenseRows]
+    forms: list[tuple[Any, ...]]
+    derived: list[tuple[Any, ...]]
+    related: list[tuple[Any, ...]]
+
+
+class LineChunk(NamedTuple):
+    """Raw lines handed to a parser, with the input position they end at.
+
+    ``covered`` counts every non-empty line in the chunk, including the ones
+    rejected by the pre-filter, so ``--limit`` and the processed count keep
+    counting JSON objects in the input.
+    """
+
+    covered: int
+    lines: list[tuple[int, bytes, str]]
+    end_offset: int
+    raw_offset: int
+
+
+class ParsedChunk(NamedTuple):
+    covered: int
+    rows: list[EntryRows]
+    end_offset: int
+    raw_offset: int
+
+
+def iter_line_chunks(
+    path: Path,
+    chunk_size: int,
+    limit: Optional[int] = None,
+    line_filter: Optional[LineFilter] = None,
+    start_offset: int = 0,
+    start_count: int = 0,
+    unchanged: Optional[Callable[[str], bool]] = None,
+) -> Iterator[LineChunk]:
+    """Yield chunks of ``(line_number, line, content_hash)`` worth decoding.
+
+    Reading starts at byte ``start_offset``, with ``start_count`` JSON objects
+    already processed; line numbers are counted from there. Lines for which
+    ``unchanged`` returns true are skipped without being decoded.
+    """
+
+    with open_input(path) as stream:
+        stream.seek(start_offset)
+        offset = start_offset
+        chunk: list[tuple[int, bytes, str]] = []
+        covered = 0
+        read = start_count
+        for line_number, line in enumerate(stream, start=start_count + 1):
+            if limit is not None and read >= limit:
+                break
+            offset += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            read += 1
+            covered += 1
+            if line_filter is not None and not line_filter(line):
+                continue
+            line_hash = content_hash(line)
+            if unchanged is not None and unchanged(line_hash):
+                continue
+            chunk.append((line_number, line, line_hash))
+            if len(chunk) >= chunk_size:
+                yield LineChunk(covered, chunk, offset, stream.raw_position)
+                chunk = []
+                covered = 0
+        if covered:
+            yield LineChunk(covered, chunk, offset, stream.raw_position)
+
+
+def parse_chunk(chunk: LineChunk) -> ParsedChunk:
+    """Decode a chunk of lines and shape the noun/verb entries into rows.
+
+    Runs inside pool workers, so it must not touch the database.
+    """
+
+    rows = []
+    for line_number, line, line_hash in chunk.lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+            raise ValueError(f"Invalid JSON on line {line_number}: {exc}") from exc
+        entry_rows = build_entry_rows(entry, line_hash)
+        if entry_rows is not None:
+            rows.append(entry_rows)
+    return ParsedChunk(chunk.covered, rows, chunk.end_offset, chunk.raw_offset)
+
+
+def iter_parsed_chunks(
+    chunks: Iterable[LineChunk],
+    workers: int,
+) -> Iterator[ParsedChunk]:
+    """Parse chunks with ``workers`` processes, yielding results in input order."""
+
+    if workers <= 1:
+        yield from map(parse_chunk, chunks)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        # Bound the number of in-flight chunks so a fast reader cannot pull the
+        # whole file into memory ahead of the writer.
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(parse_chunk, (chunk,)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+# Tables and columns an ``--incremental`` run writes to. Databases built
+# before them existed have to be rebuilt from scratch.
+INCREMENTAL_SCHEMA = {
+    "strings": {"id", "value"},
+    "entries_base": {"content_hash"},
+    "forms": {"tags_mask", "tag_order"},
+    "tags": {"id", "name"},
+}
+
+
+def has_incremental_schema(path: Path) -> bool:
+    """Whether ``path`` holds a database ``--incremental`` can update.
+
+    Returns ``False`` if there is no database there yet, so the run can build
+    one from scratch. Raises ``ValueError`` for a database with an older
+    schema. The file is opened read-only, so it is left as it was either way.
+    """
+
+    if not path.exists():
+        return False
+    connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        tables = {
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        if not tables - {"import_checkpoint"}:
+            return False
+        for table, columns in INCREMENTAL_SCHEMA.items():
+            present = {
+                row[1] for row in connection.execute(f"PRAGMA table_info({table})")
+            }
+            if not columns <= present:
+                raise ValueError(
+                    f"{path} was built with an older schema ({table} lacks "
+                    f"{', '.join(sorted(columns - present))}); rebuild it without "
+                    "--incremental."
+                )
+    finally:
+        connection.close()
+    return True
+
+
+class SnapshotDelta:
+    """Track which entries of the previous snapshot reappear unchanged.
+
+    Every entry stores the content hash of its source line. While a new dump
+    is read, lines whose hash is already stored claim that entry and are not
+    decoded at all; changed and new lines are inserted as fresh entries.
+    Whatever was not claimed at the end is stale (changed or gone) and is
+    deleted, and ``ON DELETE CASCADE`` removes its senses, forms and terms.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.stored: dict[str, list[int]] = {}
+        for entry_id, line_hash in connection.execute(
+            "SELECT id, content_hash FROM entries_base"
+        ):
+            self.stored.setdefault(line_hash, []).append(entry_id)
+        self.claimed: set[int] = set()
+        self.removed = 0
+        self.changed = 0
+        self.added = 0
+        self.pruned_strings = 0
+
+    def claim(self, line_hash: str) -> bool:
+        entry_ids = self.stored.get(line_hash)
+        if not entry_ids:
+            return False
+        self.claimed.add(entry_ids.pop())
+        return True
+
+    def claim_prefix(
+        self,
+        path: Path,
+        end_offset: int,
+        line_filter: Optional[LineFilter],
+    ) -> None:
+        """Re-claim the lines an interrupted run already went through."""
+
+        with open_input(path) as stream:
+            offset = 0
+            for line in stream:
+                offset += len(line)
+                if offset > end_offset:
+                    break
+                line = line.strip()
+                if not line or (line_filter is not None and not line_filter(line)):
+                    continue
+                self.claim(content_hash(line))
+
+    def remove_stale(self, connection: sqlite3.Connection) -> int:
+        """Delete unclaimed entries from the previous snapshot."""
+
+        stale_ids = [
+            entry_id
+            for entry_ids in self.stored.values()
+            for entry_id in entry_ids
+            if entry_id not in self.claimed
+        ]
+        stale_keys = set()
+        for start in range(0, len(stale_ids), 500):
+            batch = stale_ids[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            stale_keys.update(
+                key
+                for (key,) in connection.execute(
+                    f"SELECT entry_key FROM entries_base WHERE id IN ({placeholders})",
+                    batch,
+                )
+            )
+        connection.executemany(
+            "DELETE FROM entries_base WHERE id = ?",
+            [(entry_id,) for entry_id in stale_ids],
+        )
+        self.pruned_strings = prune_strings(connection)
+
+        fresh_keys = [
+            key
+            for entry_id, key in connection.execute(
+                "SELECT id, entry_key FROM entries_base"
+            )
+            if entry_id not in self.claimed
+        ]
+        self.changed = sum(1 for key in fresh_keys if key in stale_keys)
+        self.added = len(fresh_keys) - self.changed
+        self.removed = len(stale_ids)
+        return self.removed
+
+
 def process_entries(
     source_path: Path,
     connection: sqlite3.Connection,
     limit: Optional[int] = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    line_filter: Optional[LineFilter] = LINE_FILTER,
+    checkpoint: Optional[Checkpoint] = None,
+    delta: Optional[SnapshotDelta] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> tuple[int, int]:
+    """Import ``source_path``, committing a checkpoint after every chunk.
+
+    Passing the ``checkpoint`` of an interrupted run continues from its byte
+    offset. With a ``delta``, lines whose content hash is already stored are
+    skipped and entries missing from the input are deleted at the end.
+    ``progress`` receives byte-based ``ProgressEvent``s. Returns the processed
+    JSON object count and the number of entries in the database.
+    """
+
     cursor = connection.cursor()
 
     processed = 0
-    inserted = 0
-    for entry in iter_jsonl(source_path):
-        if limit is not None and processed >= limit:
+    offset = 0
+    if checkpoint is not None:
+        processed = checkpoint.entries
+        offset = checkpoint.byte_offset
+    unchanged = None
+    if delta is not None:
+        unchanged = delta.claim
+        if offset:
+            delta.claim_prefix(source_path, offset, line_filter)
+    inserted = connection.execute("SELECT COUNT(*) FROM entries_base").fetchone()[0]
+    tags = TagDictionary(connection)
+    strings = StringPool(connection)
+    tracker = ProgressTracker(source_path.stat().st_size, progress, None)
+    chunks = iter_line_chunks(
+        source_path, chunk_size, limit, line_filter, offset, processed, unchanged
+    )
+    for parsed in iter_parsed_chunks(chunks, workers):
+        processed += parsed.covered
+        offset = parsed.end_offset
+        for entry_rows in parsed.rows:
+            insert_entry(cursor, entry_rows, tags, strings)
+            inserted += 1
+            tracker.add_rows(count_rows(entry_rows))
+        save_checkpoint(connection, source_path, offset, processed)
+        connection.commit()
+        tracker.update(parsed.raw_offset, processed)
+
+    if delta is not None:
+        inserted -= delta.remove_stale(connection)
+    save_checkpoint(connection, source_path, offset, processed, completed=True)
+    connection.commit()
+    tracker.finish()
+    return processed, inserted
+
+
+def build_entry_rows(
+    entry: dict[str, Any],
+    line_hash: Optional[str] = None,
+) -> Optional[EntryRows]:
+    if not is_target_entry(entry):
+        return None
+
+    word = entry.get("word")
+    if not word:
+        return None
+
+    primary_translation = None
+    senses_payload = entry.get("senses") or []
+    for sense in senses_payload:
+        glosses = sense.get("glosses") or sense.get("raw_glosses") or []
+        if glosses:
+            primary_translation = glosses[0]
             break
 
-        processed += 1
+    return EntryRows(
+        values=(
+            word,
+            entry.get("pos"),
+            primary_translation,
+            entry.get("etymology_text"),
+            entry_key(entry),
+            line_hash,
+        ),
+        senses=[build_sense_rows(sense) for sense in senses_payload],
+        forms=build_form_rows(entry.get("forms") or []),
+        derived=build_terms_rows(table="derived_terms", items=entry.get("derived")),
+        related=build_terms_rows(table="related_terms", items=entry.get("related")),
+    )
 
-        if entry.get("pos") not in TARGET_PARTS_OF_SPEECH:
-            continue
 
-        word = entry.get("word")
-        if not word:
-            continue
+def build_sense_rows(sense: dict[str, Any]) -> SenseRows:
+    sense_identifier = sense.get("id")
+    glosses = sense.get("glosses")
+    raw_glosses = sense.get("raw_glosses")
+    gloss = None
+    if glosses:
+        gloss = glosses[0]
+    elif raw_glosses:
+        gloss = raw_glosses[0]
+
+    return SenseRows(
+        values=(
+            sense_identifier,
+            gloss,
+            json_or_none(glosses),
+            json_or_none(raw_glosses),
+            json_or_none(sense.get("tags")),
+            json_or_none(sense.get("topics")),
+            json_or_none(sense.get("links")),
+            json_or_none(sense.get("categories")),
+            json_or_none(sense.get("examples")),
+            json_or_none(sense.get("form_of")),
+        ),
+        derived=build_terms_rows(
+            table="derived_terms",
+            items=sense.get("derived"),
+            sense_identifier=sense_identifier,
+        ),
+        related=build_terms_rows(
+            table="related_terms",
+            items=sense.get("related"),
+            sense_identifier=sense_identifier,
+        ),
+        synonyms=build_syn_ant_rows(sense.get("synonyms")),
+        antonyms=build_syn_ant_rows(sense.get("antonyms")),
+    )
+
 
-        primary_translation = None
-        senses_payload = entry.get("senses") or []
-        for sense in senses_payload:
-            glosses = sense.get("glosses") or sense.get("raw_glosses") or []
-            if glosses:
-                primary_translation = glosses[0]
+SENSE_JSON_COLUMNS = {
+    "glosses_json": "glosses",
+    "raw_glosses_json": "raw_glosses",
+    "tags_json": "tags",
+    "topics_json": "topics",
+    "links_json": "links",
+    "categories_json": "categories",
+    "examples_json": "examples",
+    "form_of_json": "form_of",
+}
+
+
+def verify_json_columns(
+    connection: sqlite3.Connection,
+    source_path: Path,
+    sample_size: int,
+) -> dict[str, int]:
+    """Check that stored sense JSON decodes back to the source structures.
+
+    The first ``sample_size`` imported entries of ``source_path`` are matched
+    to their rows by content hash. The tags ``forms_with_tags`` rebuilds for
+    their forms are checked too. Raises ``ValueError`` on any difference.
+    """
+
+    entry_ids = dict(connection.execute("SELECT content_hash, id FROM entries_base"))
+    columns = ", ".join(SENSE_JSON_COLUMNS)
+    stats = {"entries": 0, "values": 0, "mismatches": 0}
+    with open_input(source_path) as stream:
+        for line in stream:
+            if stats["entries"] >= sample_size:
                 break
+            line = line.strip()
+            if not line or not LINE_FILTER(line):
+                continue
+            entry = json.loads(line)
+            entry_id = entry_ids.get(content_hash(line))
+            if entry_id is None or build_entry_rows(entry) is None:
+                continue
+            stats["entries"] += 1
+            stored = connection.execute(
+                f"SELECT {columns} FROM senses WHERE entry_id = ? ORDER BY id",
+                (entry_id,),
+            ).fetchall()
+            senses = entry.get("senses") or []
+            if len(stored) != len(senses):
+                stats["mismatches"] += 1
+                continue
+            for row, sense in zip(stored, senses):
+                for value, key in zip(row, SENSE_JSON_COLUMNS.values()):
+                    stats["values"] += 1
+                    decoded = json.loads(value) if value is not None else None
+                    if decoded != (sense.get(key) or None):
+                        stats["mismatches"] += 1
+            stored_tags = connection.execute(
+                "SELECT tags_json FROM forms_with_tags WHERE entry_id = ? ORDER BY id",
+                (entry_id,),
+            ).fetchall()
+            forms = build_form_rows(entry.get("forms") or [])
+            if len(stored_tags) != len(forms):
+                stats["mismatches"] += 1
+                continue
+            for (value,), (_, tags, _) in zip(stored_tags, forms):
+                stats["values"] += 1
+                decoded = json.loads(value) if value is not None else None
+                if decoded != (list(tags) or None):
+                    stats["mismatches"] += 1
 
-        cursor.execute(
-            """
-            INSERT INTO entries (word, pos, primary_translation, etymology)
-            VALUES (?, ?, ?, ?)
-            """,
+    if stats["mismatches"]:
+        raise ValueError(
+            f"{stats['mismatches']} stored JSON values in the first "
+            f"{stats['entries']} entries differ from {source_path}"
+        )
+    return stats
+
+
+def build_form_rows(forms: Iterable[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    rows = []
+    for form_payload in forms:
+        form = form_payload.get("form")
+        if not form:
+            continue
+        tags = form_payload.get("tags") or ()
+        rows.append(
             (
-                word,
-                entry.get("pos"),
-                primary_translation,
-                entry.get("etymology_text"),
-            ),
+                form,
+                tuple(tag for tag in tags if isinstance(tag, str)),
+                form_payload.get("source"),
+            )
         )
-        entry_id = cursor.lastrowid
-        inserted += 1
+    return rows
 
-        insert_senses(cursor, entry_id, senses_payload)
-        insert_forms(cursor, entry_id, entry.get("forms") or [])
-        insert_terms_collection(
-            cursor,
-            table="derived_terms",
-            entry_id=entry_id,
-            items=entry.get("derived"),
+
+def build_terms_rows(
+    *,
+    table: str,
+    items: Optional[Iterable[Any]],
+    sense_identifier: Optional[str] = None,
+) -> list[tuple[Any, ...]]:
+    if not items:
+        return []
+
+    rows = []
+    for item in items:
+        term = normalise_term(item)
+        if not term:
+            continue
+
+        extra_json = None
+        tags_json = None
+        if isinstance(item, dict):
+            metadata = {
+                k: v
+                for k, v in item.items()
+                if k not in {"word", "term", "text", "english", "translation"}
+            }
+            if metadata:
+                if table == "related_terms":
+                    tags = metadata.pop("tags", None)
+                    tags_json = json_or_none(tags)
+                extra_json = json_or_none(metadata)
+
+        if table == "derived_terms":
+            rows.append((term, sense_identifier, extra_json))
+        elif table == "related_terms":
+            rows.append((term, sense_identifier, tags_json, extra_json))
+        else:  # pragma: no cover - guarded by caller
+            raise ValueError(f"Unsupported table for term insertion: {table}")
+    return rows
+
+
+def build_syn_ant_rows(items: Optional[Iterable[Any]]) -> list[tuple[Any, ...]]:
+    if not items:
+        return []
+
+    rows = []
+    for item in items:
+        term = normalise_term(item)
+        if not term:
+            continue
+
+        tags_json = None
+        extra_json = None
+        if isinstance(item, dict):
+            tags_json = json_or_none(item.get("tags"))
+            metadata = {
+                k: v
+                for k, v in item.items()
+                if k not in {"word", "term", "text", "english", "translation", "tags"}
+            }
+            extra_json = json_or_none(metadata)
+
+        rows.append((term, tags_json, extra_json))
+    return rows
+
+
+def count_rows(entry_rows: EntryRows) -> dict[str, int]:
+    """Number of rows ``insert_entry`` writes per table for ``entry_rows``."""
+
+    counts = {
+        "entries": 1,
+        "senses": len(entry_rows.senses),
+        "forms": len(entry_rows.forms),
+        "derived_terms": len(entry_rows.derived),
+        "related_terms": len(entry_rows.related),
+        "synonyms": 0,
+        "antonyms": 0,
+    }
+    for sense in entry_rows.senses:
+        counts["derived_terms"] += len(sense.derived)
+        counts["related_terms"] += len(sense.related)
+        counts["synonyms"] += len(sense.synonyms)
+        counts["antonyms"] += len(sense.antonyms)
+    return counts
+
+
+class TagDictionary:
+    """Map tag names to ``tags`` ids, registering unseen tags on first use.
+
+    Ids are handed out in the order tags are first inserted, which is the
+    input order whatever the worker count, so databases stay identical.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.ids: dict[str, int] = dict(connection.execute("SELECT name, id FROM tags"))
+
+    def encode(
+        self, cursor: sqlite3.Cursor, tags: Sequence[str]
+    ) -> tuple[int, list[int], Optional[str]]:
+        """Return the bitmask, the overflow tag ids and the order of ``tags``.
+
+        The order is a JSON array of the tag ids as given, or ``None`` when
+        the tags are sorted by name without repeats and the set says it all.
+        """
+
+        mask = 0
+        extra = []
+        ids = []
+        for tag in tags:
+            tag_id = self.ids.get(tag)
+            if tag_id is None:
+                tag_id = len(self.ids)
+                cursor.execute(
+                    "INSERT INTO tags (id, name) VALUES (?, ?)", (tag_id, tag)
+                )
+                self.ids[tag] = tag_id
+            ids.append(tag_id)
+            if tag_id < TAG_MASK_BITS:
+                mask |= 1 << tag_id
+            elif tag_id not in extra:
+                extra.append(tag_id)
+        if list(tags) == sorted(set(tags)):
+            return mask, extra, None
+        return mask, extra, json.dumps(ids, separators=(",", ":"))
+
+
+class StringPool:
+    """Intern glosses and terms into ``strings``, one row per distinct value.
+
+    As with ``TagDictionary``, ids are assigned by the writer in input order.
+    The in-memory map stands in for a ``UNIQUE`` index, which would store
+    every string a second time.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.ids: dict[str, int] = dict(
+            connection.execute("SELECT value, id FROM strings")
         )
-        insert_terms_collection(
-            cursor,
-            table="related_terms",
-            entry_id=entry_id,
-            items=entry.get("related"),
+        self.next_id = max(self.ids.values(), default=0) + 1
+
+    def intern(self, cursor: sqlite3.Cursor, value: Optional[str]) -> Optional[int]:
+        if value is None:
+            return None
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.next_id
+            self.next_id += 1
+            cursor.execute(
+                "INSERT INTO strings (id, value) VALUES (?, ?)", (string_id, value)
+            )
+            self.ids[value] = string_id
+        return string_id
+
+
+def prune_strings(connection: sqlite3.Connection) -> int:
+    """Delete pooled strings no longer referenced by any row."""
+
+    cursor = connection.execute(
+        """
+        DELETE FROM strings WHERE id NOT IN (
+            SELECT primary_translation_id FROM entries_base
+            WHERE primary_translation_id IS NOT NULL
+            UNION SELECT gloss_id FROM senses_base WHERE gloss_id IS NOT NULL
+            UNION SELECT term_id FROM derived_terms_base
+            UNION SELECT term_id FROM related_terms_base
+            UNION SELECT term_id FROM synonyms_base
+            UNION SELECT term_id FROM antonyms_base
         )
+        """
+    )
+    return cursor.rowcount
 
-    connection.commit()
-    return processed, inserted
+
+def find_forms_by_tags(
+    connection: sqlite3.Connection, tags: Iterable[str]
+) -> list[tuple[int, str]]:
+    """Return ``(entry_id, form)`` for forms carrying all of ``tags``.
+
+    e.g. ``find_forms_by_tags(connection, ["illative", "plural"])``. Common
+    tags are matched with an integer bitmask test; rare ones through
+    ``form_extra_tags``.
+    """
+
+    dictionary = TagDictionary(connection)
+    mask = 0
+    extra = []
+    for tag in tags:
+        tag_id = dictionary.ids.get(tag)
+        if tag_id is None:
+            return []
+        if tag_id < TAG_MASK_BITS:
+            mask |= 1 << tag_id
+        else:
+            extra.append(tag_id)
+    query = "SELECT entry_id, form FROM forms WHERE tags_mask & ? = ?"
+    params: list[Any] = [mask, mask]
+    for tag_id in extra:
+        query += (
+            " AND EXISTS (SELECT 1 FROM form_extra_tags"
+            " WHERE form_id = forms.id AND tag_id = ?)"
+        )
+        params.append(tag_id)
+    return connection.execute(query + " ORDER BY id", params).fetchall()
+
+
+def insert_entry(
+    cursor: sqlite3.Cursor,
+    entry_rows: EntryRows,
+    tags: TagDictionary,
+    strings: StringPool,
+) -> int:
+    word, pos, primary_translation, etymology, key, line_hash = entry_rows.values
+    cursor.execute(
+        """
+        INSERT INTO entries_base (
+            word,
+            pos,
+            primary_translation_id,
+            etymology,
+            entry_key,
+            content_hash
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (
+            word,
+            pos,
+            strings.intern(cursor, primary_translation),
+            etymology,
+            key,
+            line_hash,
+        ),
+    )
+    entry_id = cursor.lastrowid
+
+    insert_senses(cursor, entry_id, entry_rows.senses, strings)
+    insert_forms(cursor, entry_id, entry_rows.forms, tags)
+    insert_terms_collection(
+        cursor,
+        table="derived_terms",
+        entry_id=entry_id,
+        rows=entry_rows.derived,
+        strings=strings,
+    )
+    insert_terms_collection(
+        cursor,
+        table="related_terms",
+        entry_id=entry_id,
+        rows=entry_rows.related,
+        strings=strings,
+    )
+    return entry_id
 
 
 def insert_senses(
     cursor: sqlite3.Cursor,
     entry_id: int,
-    senses: Iterable[dict[str, Any]],
+    senses: Iterable[SenseRows],
+    strings: StringPool,
 ) -> None:
     for sense in senses:
-        sense_identifier = sense.get("id")
-        glosses = sense.get("glosses")
-        raw_glosses = sense.get("raw_glosses")
-        gloss = None
-        if glosses:
-            gloss = glosses[0]
-        elif raw_glosses:
-            gloss = raw_glosses[0]
-
+        sense_identifier, gloss, *json_values = sense.values
         cursor.execute(
             """
-            INSERT INTO senses (
+            INSERT INTO senses_base (
                 entry_id,
                 sense_identifier,
-                gloss,
+                gloss_id,
                 glosses_json,
                 raw_glosses_json,
                 tags_json,
@@ -283,15 +1269,8 @@ def insert_senses(
             (
                 entry_id,
                 sense_identifier,
-                gloss,
-                json_or_none(glosses),
-                json_or_none(raw_glosses),
-                json_or_none(sense.get("tags")),
-                json_or_none(sense.get("topics")),
-                json_or_none(sense.get("links")),
-                json_or_none(sense.get("categories")),
-                json_or_none(sense.get("examples")),
-                json_or_none(sense.get("form_of")),
+                strings.intern(cursor, gloss),
+                *json_values,
             ),
         )
         sense_id = cursor.lastrowid
@@ -300,48 +1279,59 @@ def insert_senses(
             cursor,
             table="derived_terms",
             entry_id=entry_id,
-            items=sense.get("derived"),
-            sense_identifier=sense_identifier,
+            rows=sense.derived,
+            strings=strings,
         )
         insert_terms_collection(
             cursor,
             table="related_terms",
             entry_id=entry_id,
-            items=sense.get("related"),
-            sense_identifier=sense_identifier,
+            rows=sense.related,
+            strings=strings,
         )
 
         insert_syn_ant_collection(
-            cursor, table="synonyms", sense_id=sense_id, items=sense.get("synonyms")
+            cursor,
+            table="synonyms",
+            sense_id=sense_id,
+            rows=sense.synonyms,
+            strings=strings,
         )
         insert_syn_ant_collection(
             cursor,
             table="antonyms",
             sense_id=sense_id,
-            items=sense.get("antonyms"),
+            rows=sense.antonyms,
+            strings=strings,
         )
 
 
 def insert_forms(
     cursor: sqlite3.Cursor,
     entry_id: int,
-    forms: Iterable[dict[str, Any]],
+    forms: Iterable[tuple[Any, ...]],
+    tags: TagDictionary,
 ) -> None:
-    for form_payload in forms:
-        form = form_payload.get("form")
-        if not form:
-            continue
-        cursor.execute(
-            """
-            INSERT INTO forms (entry_id, form, tags_json, source)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                entry_id,
-                form,
-                json_or_none(form_payload.get("tags")),
-                form_payload.get("source"),
-            ),
+    rows = []
+    extra_tags = []
+    for form, form_tags, source in forms:
+        mask, extra, order = tags.encode(cursor, form_tags)
+        rows.append((entry_id, form, mask, order, source))
+        extra_tags.append(extra)
+    statement = """
+        INSERT INTO forms (entry_id, form, tags_mask, tag_order, source)
+        VALUES (?, ?, ?, ?, ?)
+        """
+    if not any(extra_tags):
+        cursor.executemany(statement, rows)
+        return
+    # Overflow tags need each form's id, so insert one at a time.
+    for row, extra in zip(rows, extra_tags):
+        cursor.execute(statement, row)
+        form_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO form_extra_tags (form_id, tag_id) VALUES (?, ?)",
+            [(form_id, tag_id) for tag_id in extra],
         )
 
 
@@ -350,55 +1340,36 @@ def insert_terms_collection(
     *,
     table: str,
     entry_id: int,
-    items: Optional[Iterable[Any]],
-    sense_identifier: Optional[str] = None,
+    rows: Iterable[tuple[Any, ...]],
+    strings: StringPool,
 ) -> None:
-    if not items:
-        return
-
-    for item in items:
-        term = normalise_term(item)
-        if not term:
-            continue
-
-        extra_json = None
-        tags_json = None
-        if isinstance(item, dict):
-            metadata = {
-                k: v
-                for k, v in item.items()
-                if k not in {"word", "term", "text", "english", "translation"}
-            }
-            if metadata:
-                if table == "related_terms":
-                    tags = metadata.pop("tags", None)
-                    tags_json = json_or_none(tags)
-                extra_json = json_or_none(metadata)
-
-        if table == "derived_terms":
-            cursor.execute(
-                """
-                INSERT INTO derived_terms (entry_id, term, source_sense_identifier, extra_json)
-                VALUES (?, ?, ?, ?)
-                """,
-                (entry_id, term, sense_identifier, extra_json),
+    rows = [(entry_id, strings.intern(cursor, term), *values) for term, *values in rows]
+    if table == "derived_terms":
+        cursor.executemany(
+            """
+            INSERT INTO derived_terms_base (
+                entry_id, term_id, source_sense_identifier, extra_json
             )
-        elif table == "related_terms":
-            cursor.execute(
-                """
-                INSERT INTO related_terms (
-                    entry_id,
-                    term,
-                    source_sense_identifier,
-                    tags_json,
-                    extra_json
-                )
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (entry_id, term, sense_identifier, tags_json, extra_json),
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+    elif table == "related_terms":
+        cursor.executemany(
+            """
+            INSERT INTO related_terms_base (
+                entry_id,
+                term_id,
+                source_sense_identifier,
+                tags_json,
+                extra_json
             )
-        else:  # pragma: no cover - guarded by caller
-            raise ValueError(f"Unsupported table for term insertion: {table}")
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+    else:  # pragma: no cover - guarded by caller
+        raise ValueError(f"Unsupported table for term insertion: {table}")
 
 
 def insert_syn_ant_collection(
@@ -406,34 +1377,16 @@ def insert_syn_ant_collection(
     *,
     table: str,
     sense_id: int,
-    items: Optional[Iterable[Any]],
+    rows: Iterable[tuple[Any, ...]],
+    strings: StringPool,
 ) -> None:
-    if not items:
-        return
-
-    for item in items:
-        term = normalise_term(item)
-        if not term:
-            continue
-
-        tags_json = None
-        extra_json = None
-        if isinstance(item, dict):
-            tags_json = json_or_none(item.get("tags"))
-            metadata = {
-                k: v
-                for k, v in item.items()
-                if k not in {"word", "term", "text", "english", "translation", "tags"}
-            }
-            extra_json = json_or_none(metadata)
-
-        cursor.execute(
-            f"""
-            INSERT INTO {table} (sense_id, term, tags_json, extra_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            (sense_id, term, tags_json, extra_json),
-        )
+    cursor.executemany(
+        f"""
+        INSERT INTO {table}_base (sense_id, term_id, tags_json, extra_json)
+        VALUES (?, ?, ?, ?)
+        """,
+        [(sense_id, strings.intern(cursor, term), *values) for term, *values in rows],
+    )
 
 
 def main() -> None:
@@ -442,15 +1395,71 @@ def main() -> None:
     if not args.input_path.exists():
         raise FileNotFoundError(f"Input file not found: {args.input_path}")
 
+    line_filter = None if args.no_prefilter else LINE_FILTER
+    if args.verify_prefilter and line_filter is not None:
+        stats = verify_line_filter(
+            args.input_path, line_filter, is_target_entry, args.verify_prefilter
+        )
+        print(
+            "Pre-filter check passed: {candidates} of {sampled} sampled lines decoded, "
+            "{false_positives} false positives.".format(**stats)
+        )
+
+    if args.incremental:
+        if args.limit is not None:
+            raise ValueError("--incremental cannot be combined with --limit")
+        has_schema = has_incremental_schema(args.output_path)
+
     connection = sqlite3.connect(args.output_path)
     try:
         connection.execute("PRAGMA journal_mode = WAL")
         connection.execute("PRAGMA synchronous = NORMAL")
-        init_database(connection)
-        processed, inserted = process_entries(args.input_path, connection, args.limit)
+        connection.execute("PRAGMA foreign_keys = ON")
+        checkpoint = None
+        if args.resume:
+            checkpoint = load_checkpoint(connection, args.input_path)
+        if checkpoint is not None and checkpoint.completed:
+            print(f"{args.output_path} already holds a completed import.")
+            return
+        delta = None
+        if args.incremental:
+            if not has_schema:
+                print(f"{args.output_path} holds no dictionary yet; building it.")
+                init_database(connection)
+            ensure_checkpoint_table(connection)
+            delta = SnapshotDelta(connection)
+        elif checkpoint is None:
+            init_database(connection)
+        if checkpoint is not None:
+            print(
+                f"Resuming at byte {checkpoint.byte_offset} after {checkpoint.entries} JSON objects."
+            )
+        processed, inserted = process_entries(
+            args.input_path,
+            connection,
+            args.limit,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            line_filter=line_filter,
+            checkpoint=checkpoint,
+            delta=delta,
+            progress=None if args.quiet else print_progress,
+        )
+        if args.verify_json:
+            stats = verify_json_columns(connection, args.input_path, args.verify_json)
+            print(
+                "JSON check passed: {values} values in {entries} entries "
+                "decode to the source structures.".format(**stats)
+            )
     finally:
         connection.close()
 
+    if delta is not None:
+        print(
+            f"Incremental update: {len(delta.claimed)} unchanged, {delta.changed} changed, "
+            f"{delta.added} added, {delta.removed} stale entries and "
+            f"{delta.pruned_strings} unused strings removed."
+        )
     print(
         "Completed. Processed {processed} JSON objects, inserted {inserted} noun/verb entries into {output}.".format(
             processed=processed,
@@ -458,6 +1467,9 @@ def main() -> None:
             output=args.output_path,
         )
     )
+    if args.finalize:
+        finalize_database(args.output_path)
+        print(f"Finalized {args.output_path} as a read-only artifact.")
 
 
 if __name__ == "__main__":
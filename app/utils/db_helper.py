@@ -1,44 +1,810 @@
+import asyncio
+import atexit
+import bisect
+import heapq
+import json
+import logging
+import re
 import sqlite3
+import threading
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Optional
-from app.states.state import Verb, Noun, WiktionaryResult
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, TypeVar
+from app.states.state import (
+    Completion,
+    FormAnalysis,
+    Noun,
+    TranslationMatch,
+    Verb,
+    WiktionaryResult,
+)
+from app.utils.db_finalize import is_finalized
 
 DATA_DIR = Path(".web")
 DB_FILE = DATA_DIR / "finnish_dictionary.db"
 
+# Read-side tuning: at most POOL_SIZE lookups run at once, each connection
+# maps the file and caches hot pages. Prepared statements are kept by
+# sqlite3's default cache of 128 per connection: it holds the dozen fixed
+# queries below plus the IN (...) variants batch lookups add, each used again
+# by the next lookup on the same connection.
+POOL_SIZE = 4
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 16 * 1024
+# Lookup results kept in memory; a few thousand common words cover most use.
+LOOKUP_CACHE_SIZE = 4096
+# Words per IN (...) query, well under SQLite's bound-parameter limit.
+BATCH_QUERY_SIZE = 500
+SEARCH_LIMIT = 20
+# Typeahead: at most COMPLETION_MAX_ENTRIES lemmas and forms are held in
+# memory. Prefixes matching more than COMPLETION_SCAN_LIMIT of them get their
+# best COMPLETION_MAX_LIMIT completions precomputed instead of scanned.
+COMPLETION_MAX_ENTRIES = 300_000
+COMPLETION_SCAN_LIMIT = 256
+COMPLETION_LIMIT = 8
+COMPLETION_MAX_LIMIT = 20
 
-def get_word_details(word: str) -> Optional[WiktionaryResult]:
-    if not DB_FILE.exists():
-        return None
-    conn = sqlite3.connect(DB_FILE)
+
+def _connect() -> sqlite3.Connection:
+    """Open the dictionary read-only; immutable once it has been finalized.
+
+    An immutable connection skips file locking and WAL checks, which is only
+    safe because a finalized database is never written in place.
+    """
+    mode = "ro&immutable=1" if is_finalized(DB_FILE) else "ro"
+    conn = sqlite3.connect(
+        f"{DB_FILE.resolve().as_uri()}?mode={mode}",
+        uri=True,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM words WHERE word = ?", (word,))
-    word_entry = cursor.fetchone()
-    if not word_entry:
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    return conn
+
+
+def database_identity() -> Optional[tuple[int, int, int]]:
+    """Device, inode and mtime of ``DB_FILE``, or ``None`` if it is missing.
+
+    The importers replace the file with an atomic rename, so a new identity
+    means a new database has been swapped in.
+    """
+    try:
+        stat = DB_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
+
+class ConnectionPool:
+    """A bounded, thread-safe pool of read-only connections to ``DB_FILE``.
+
+    Idle connections are reused for as long as the file keeps its identity.
+    Once a new database has been swapped in, idle connections to the old one
+    are closed and connections still in use are closed when they come back,
+    so queries already running finish on the old file.
+    """
+
+    def __init__(self, size: int = POOL_SIZE) -> None:
+        self.size = size
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._identity: Optional[tuple[int, int, int]] = None
+        self._closed = False
+
+    @contextmanager
+    def connection(self) -> Iterator[Optional[sqlite3.Connection]]:
+        """Borrow a connection; yields ``None`` if there is no database."""
+        identity = database_identity()
+        if identity is None:
+            yield None
+            return
+        with self._slots:
+            conn = self._take(identity)
+            try:
+                yield conn
+            finally:
+                self._give(identity, conn)
+
+    def _take(self, identity: tuple[int, int, int]) -> sqlite3.Connection:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+            if identity != self._identity:
+                self._close_idle()
+                self._identity = identity
+            if self._idle:
+                return self._idle.pop()
+        return _connect()
+
+    def _give(self, identity: tuple[int, int, int], conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if not self._closed and identity == self._identity:
+                self._idle.append(conn)
+                return
         conn.close()
+
+    def _close_idle(self) -> None:
+        for conn in self._idle:
+            conn.close()
+        self._idle.clear()
+
+    def close(self) -> None:
+        """Close idle connections and refuse new lookups."""
+        with self._lock:
+            self._closed = True
+            self._close_idle()
+
+
+_pool = ConnectionPool()
+atexit.register(_pool.close)
+
+
+def close_connections() -> None:
+    """Shut the pool and the async lookup threads down, e.g. on app shutdown."""
+    _executor.shutdown(wait=True, cancel_futures=True)
+    _pool.close()
+
+
+@asynccontextmanager
+async def lookup_lifespan() -> AsyncIterator[None]:
+    """Reflex lifespan task: builds the typeahead index, closes lookups on exit."""
+    load_completion_index()
+    try:
+        yield
+    finally:
+        close_connections()
+
+
+_MISSING = object()
+
+
+class LookupCache:
+    """A size-bounded LRU of lookup results, including words not found.
+
+    Entries belong to one database identity: the first access with another
+    identity (a new file has been swapped in) empties the cache. Cached
+    results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = LOOKUP_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Optional[WiktionaryResult]] = OrderedDict()
+        self._identity: Optional[tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, identity: tuple[int, int, int], word: str):
+        """The cached result for ``word``, or ``_MISSING``."""
+        with self._lock:
+            if identity != self._identity:
+                if self._entries:
+                    self.invalidations += 1
+                    self._entries.clear()
+                self._identity = identity
+            result = self._entries.get(word, _MISSING)
+            if result is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(word)
+            return result
+
+    def put(
+        self,
+        identity: tuple[int, int, int],
+        word: str,
+        result: Optional[WiktionaryResult],
+    ) -> None:
+        with self._lock:
+            if identity != self._identity:
+                return
+            self._entries[word] = result
+            self._entries.move_to_end(word)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+_cache = LookupCache()
+
+
+def lookup_cache_stats() -> dict[str, int]:
+    return _cache.stats()
+
+
+def clear_lookup_cache() -> None:
+    _cache.clear()
+
+
+def get_word_details(word: str) -> Optional[WiktionaryResult]:
+    identity = database_identity()
+    if identity is None:
         return None
-    word_id = word_entry["id"]
-    pos = word_entry["pos"]
-    if pos == "verb":
-        cursor.execute(
-            "SELECT person, form FROM verb_conjugations WHERE word_id = ?", (word_id,)
+    result = _cache.get(identity, word)
+    if result is not _MISSING:
+        return result
+    return _fetch_word_details(identity, word)
+
+
+def _fetch_word_details(
+    identity: tuple[int, int, int], word: str
+) -> Optional[WiktionaryResult]:
+    with _pool.connection() as conn:
+        if conn is None:
+            return None
+        result = _read_words_details(conn, [word])[word]
+    _cache.put(identity, word, result)
+    return result
+
+
+def get_words_details(
+    words: Iterable[str],
+) -> dict[str, Optional[WiktionaryResult]]:
+    """Look up many words at once; words not found map to ``None``.
+
+    Cached words are served from memory and the rest are fetched on one
+    connection with a query per table for every ``BATCH_QUERY_SIZE`` words.
+    """
+    words = list(dict.fromkeys(words))
+    identity = database_identity()
+    if identity is None:
+        return dict.fromkeys(words)
+    results = {}
+    pending = []
+    for word in words:
+        result = _cache.get(identity, word)
+        if result is _MISSING:
+            pending.append(word)
+        else:
+            results[word] = result
+    if pending:
+        with _pool.connection() as conn:
+            if conn is None:
+                return dict.fromkeys(words)
+            for start in range(0, len(pending), BATCH_QUERY_SIZE):
+                chunk = pending[start : start + BATCH_QUERY_SIZE]
+                for word, result in _read_words_details(conn, chunk).items():
+                    _cache.put(identity, word, result)
+                    results[word] = result
+    return {word: results[word] for word in words}
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """An FTS5 query matching every word of ``query``, with no operators."""
+    tokens = re.findall(r"\w+", query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+def search_by_translation(
+    query: str, limit: int = SEARCH_LIMIT, offset: int = 0
+) -> list[TranslationMatch]:
+    """Finnish words whose English translations match ``query``, best first.
+
+    Words are ranked by the bm25 score of their best matching translation,
+    which is returned with each word. ``limit`` and ``offset`` page through
+    the results.
+    """
+    expression = _match_expression(query)
+    if expression is None:
+        return []
+    with _pool.connection() as conn:
+        if conn is None:
+            return []
+        try:
+            rows = conn.execute(
+                """
+                WITH matches AS MATERIALIZED (
+                    SELECT rowid AS id, bm25(translation_search) AS score
+                    FROM translation_search
+                    WHERE translation_search MATCH ?
+                )
+                SELECT w.word, w.pos, t.translation, MIN(m.score) AS score
+                FROM matches m
+                JOIN translations t ON t.id = m.id
+                JOIN words w ON w.id = t.word_id
+                WHERE t.language_code = 'en'
+                GROUP BY w.id
+                ORDER BY score, w.word
+                LIMIT ? OFFSET ?
+                """,
+                (expression, limit, offset),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            if not _is_missing_table(e):
+                raise
+            # The database predates the search index.
+            return []
+    return [
+        TranslationMatch(
+            word=row["word"], pos=row["pos"], translation=row["translation"]
         )
-        conjugations = {row["person"]: row["form"] for row in cursor.fetchall()}
-        conn.close()
+        for row in rows
+    ]
+
+
+def resolve_form(form: str) -> list[FormAnalysis]:
+    """The lemmas ``form`` is an inflected form of, with its grammatical tags.
+
+    One analysis per (lemma, tags) pair, e.g. "talossa" gives ``talo`` with
+    ``["inessive", "singular"]``. Lemmas are in frequency-rank order if the
+    import was given a frequency list, and alphabetical otherwise.
+    """
+    with _pool.connection() as conn:
+        if conn is None:
+            return []
+        try:
+            rows = conn.execute(
+                """
+                SELECT DISTINCT w.word, w.pos, f.tags, r.rank
+                FROM word_forms f
+                JOIN words w ON w.id = f.word_id
+                LEFT JOIN word_ranks r ON r.word = w.word
+                WHERE f.form = ?
+                ORDER BY r.rank IS NULL, r.rank, w.word, f.rowid
+                """,
+                (form,),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            if not _is_missing_table(e):
+                raise
+            # The database predates the form index.
+            return []
+    return [
+        FormAnalysis(word=row["word"], pos=row["pos"], tags=row["tags"].split())
+        for row in rows
+    ]
+
+
+class CompletionIndex:
+    """Prefix completion over lemmas and inflected forms, in a fixed order.
+
+    Keys are casefolded and sorted, so the completions of a prefix are one
+    bisect range; the best of them are found with a partial sort on each
+    entry's precomputed order, or read from the precomputed top list when
+    the range is too long to scan.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]]) -> None:
+        """``entries`` are (text, lemma) pairs, best first."""
+        rows = []
+        for order, (text, word) in enumerate(entries):
+            key = text.casefold()
+            rows.append((key if key != text else text, text, word, order))
+        rows.sort()
+        self.keys = [row[0] for row in rows]
+        self.texts = [row[1] for row in rows]
+        self.words = [row[2] for row in rows]
+        self.order = array("I", (row[3] for row in rows))
+        self._top: dict[str, list[int]] = {}
+        self._precompute()
+        self.memory_bytes = self._measure()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+    def _scan(self, lo: int, hi: int, limit: int) -> list[int]:
+        return heapq.nsmallest(limit, range(lo, hi), key=self.order.__getitem__)
+
+    def _precompute(self) -> None:
+        # A prefix can only match too many keys if its parent does, so walk
+        # down from the empty prefix one character at a time.
+        pending = [""]
+        while pending:
+            prefix = pending.pop()
+            lo, hi = self._range(prefix)
+            if hi - lo <= COMPLETION_SCAN_LIMIT:
+                continue
+            self._top[prefix] = self._scan(lo, hi, COMPLETION_MAX_LIMIT)
+            index = lo
+            while index < hi:
+                key = self.keys[index]
+                if len(key) == len(prefix):
+                    index += 1
+                    continue
+                child = key[: len(prefix) + 1]
+                pending.append(child)
+                index = self._range(child)[1]
+
+    def _measure(self) -> int:
+        strings = {id(value): value for value in (*self.keys, *self.texts, *self.words)}
+        size = sum(sys.getsizeof(value) for value in strings.values())
+        size += sum(
+            sys.getsizeof(column) for column in (self.keys, self.texts, self.words)
+        )
+        size += sys.getsizeof(self.order) + sys.getsizeof(self._top)
+        size += sum(sys.getsizeof(top) for top in self._top.values())
+        return size
+
+    def complete(self, prefix: str, limit: int = COMPLETION_LIMIT) -> list[Completion]:
+        key = prefix.casefold()
+        if not key:
+            return []
+        limit = min(limit, COMPLETION_MAX_LIMIT)
+        top = self._top.get(key)
+        if top is None:
+            top = self._scan(*self._range(key), limit)
+        return [
+            Completion(text=self.texts[index], word=self.words[index])
+            for index in top[:limit]
+        ]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self.keys),
+            "precomputed_prefixes": len(self._top),
+            "memory_bytes": self.memory_bytes,
+        }
+
+
+def _completion_entries(
+    conn: sqlite3.Connection, max_entries: int = COMPLETION_MAX_ENTRIES
+) -> list[tuple[str, str]]:
+    """(text, lemma) pairs for typeahead, best first and at most ``max_entries``.
+
+    Lemmas are ordered by frequency rank if the import was given a frequency
+    list, then shorter words first; each inflected form follows its lemma. A
+    text shared by several lemmas is kept once, for the first of them.
+    """
+    try:
+        lemmas = conn.execute(
+            "SELECT w.word, r.rank FROM words w "
+            "LEFT JOIN word_ranks r ON r.word = w.word"
+        ).fetchall()
+    except sqlite3.OperationalError as e:
+        if not _is_missing_table(e):
+            raise
+        lemmas = conn.execute("SELECT word, NULL FROM words").fetchall()
+    best: dict[str, tuple[tuple, str]] = {}
+    for word, rank in lemmas:
+        best[word] = ((rank is None, rank or 0, len(word), word, 0, 0), word)
+    remaining = max_entries - len(best)
+    if remaining > 0:
+        try:
+            forms = conn.execute(
+                """
+                SELECT f.form, w.word, r.rank
+                FROM word_forms f
+                JOIN words w ON w.id = f.word_id
+                LEFT JOIN word_ranks r ON r.word = w.word
+                ORDER BY r.rank IS NULL, r.rank
+                LIMIT ?
+                """,
+                (2 * remaining,),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            if not _is_missing_table(e):
+                raise
+            forms = []
+        for form, word, rank in forms:
+            order = (rank is None, rank or 0, len(word), word, 1, len(form))
+            if form not in best or order < best[form][0]:
+                best[form] = (order, word)
+    ranked = sorted(best.items(), key=lambda item: item[1][0])[:max_entries]
+    # Share one string object per lemma between its entries.
+    lemmas_by_text = {word: word for word, _ in lemmas}
+    return [(text, lemmas_by_text.get(word, word)) for text, (_, word) in ranked]
+
+
+_completion: Optional[tuple[tuple[int, int, int], CompletionIndex]] = None
+# Identity of the database the latest build was started for; a failed build
+# is not retried until the file changes.
+_completion_started: Optional[tuple[int, int, int]] = None
+_completion_lock = threading.Lock()
+
+
+def _current_completion_index() -> Optional[CompletionIndex]:
+    """The loaded index, if it was built from the current ``DB_FILE``."""
+    loaded = _completion
+    if loaded is not None and loaded[0] == database_identity():
+        return loaded[1]
+    return None
+
+
+def _build_completion_index(identity: tuple[int, int, int]) -> None:
+    """Build the index on its own connection, outside the pool and executor."""
+    global _completion
+    try:
+        started = time.perf_counter()
+        conn = _connect()
+        try:
+            index = CompletionIndex(_completion_entries(conn))
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logging.error(f"Could not build the typeahead index: {e}")
+        return
+    logging.info(
+        f"Loaded {len(index)} completions in {time.perf_counter() - started:.1f}s "
+        f"({index.memory_bytes / 1024 / 1024:.1f} MB)"
+    )
+    with _completion_lock:
+        # A swap during the build started a newer one; keep only that.
+        if _completion_started == identity:
+            _completion = (identity, index)
+
+
+def load_completion_index() -> None:
+    """Start building the typeahead index for ``DB_FILE`` in the background.
+
+    Does nothing if the index is loaded or a build for the current file has
+    already started, so it is cheap to call on every keystroke.
+    """
+    global _completion_started
+    identity = database_identity()
+    if identity is None:
+        return
+    with _completion_lock:
+        if _completion_started == identity:
+            return
+        _completion_started = identity
+    threading.Thread(
+        target=_build_completion_index,
+        args=(identity,),
+        name="completion-index",
+        daemon=True,
+    ).start()
+
+
+def complete_word(prefix: str, limit: int = COMPLETION_LIMIT) -> list[Completion]:
+    """Lemmas and inflected forms starting with ``prefix``, in index order.
+
+    Returns nothing until the index for the current database has been built;
+    the first call after startup or a swap starts that build.
+    """
+    index = _current_completion_index()
+    if index is None:
+        load_completion_index()
+        return []
+    return index.complete(prefix, limit)
+
+
+def completion_stats() -> Optional[dict[str, int]]:
+    index = _current_completion_index()
+    return index.stats() if index is not None else None
+
+
+T = TypeVar("T")
+
+
+class LookupTimings:
+    """Queue-wait and execution times of lookups run on the executor."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.queue_wait_total = 0.0
+            self.queue_wait_max = 0.0
+            self.execution_total = 0.0
+            self.execution_max = 0.0
+
+    def record(self, queue_wait: float, execution: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.queue_wait_total += queue_wait
+            self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+            self.execution_total += execution
+            self.execution_max = max(self.execution_max, execution)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            count = self.count or 1
+            return {
+                "count": self.count,
+                "queue_wait_mean_ms": self.queue_wait_total / count * 1000,
+                "queue_wait_max_ms": self.queue_wait_max * 1000,
+                "execution_mean_ms": self.execution_total / count * 1000,
+                "execution_max_ms": self.execution_max * 1000,
+            }
+
+
+# One worker per pooled connection: more threads would only queue on the pool.
+_executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="db-lookup")
+_timings = LookupTimings()
+
+
+def lookup_timing_stats() -> dict[str, float]:
+    return _timings.stats()
+
+
+async def _run_lookup(function: Callable[..., T], *args) -> T:
+    submitted = time.perf_counter()
+
+    def run() -> T:
+        started = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            _timings.record(started - submitted, time.perf_counter() - started)
+
+    return await asyncio.get_running_loop().run_in_executor(_executor, run)
+
+
+async def get_word_details_async(word: str) -> Optional[WiktionaryResult]:
+    """``get_word_details`` for async callers; SQLite never runs on the loop.
+
+    Cached results are returned directly, everything else is read on the
+    lookup executor.
+    """
+    identity = database_identity()
+    if identity is None:
+        return None
+    result = _cache.get(identity, word)
+    if result is not _MISSING:
+        return result
+    return await _run_lookup(_fetch_word_details, identity, word)
+
+
+async def search_by_translation_async(
+    query: str, limit: int = SEARCH_LIMIT, offset: int = 0
+) -> list[TranslationMatch]:
+    """``search_by_translation`` run on the lookup executor."""
+    return await _run_lookup(search_by_translation, query, limit, offset)
+
+
+async def resolve_form_async(form: str) -> list[FormAnalysis]:
+    """``resolve_form`` run on the lookup executor."""
+    return await _run_lookup(resolve_form, form)
+
+
+async def complete_word_async(
+    prefix: str, limit: int = COMPLETION_LIMIT
+) -> list[Completion]:
+    """``complete_word``; answered inline, never queued on the executor."""
+    return complete_word(prefix, limit)
+
+
+async def get_words_details_async(
+    words: Iterable[str],
+) -> dict[str, Optional[WiktionaryResult]]:
+    """``get_words_details`` run on the lookup executor."""
+    return await _run_lookup(get_words_details, list(words))
+
+
+def _is_missing_table(error: sqlite3.OperationalError) -> bool:
+    return str(error).startswith("no such table")
+
+
+def get_word_card(word: str) -> Optional[dict[str, Any]]:
+    """The word's precomputed card: forms, Kotus verb type, top glosses, rank.
+
+    ``None`` if the word has no card (not a verb or noun, or a database
+    built before cards existed). The rank is ``None`` unless the import was
+    given a frequency list.
+    """
+    with _pool.connection() as conn:
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT card FROM word_cards WHERE word = ?", (word,)
+            ).fetchone()
+        except sqlite3.OperationalError as e:
+            if not _is_missing_table(e):
+                raise
+            return None
+    return json.loads(row["card"]) if row else None
+
+
+def _make_result(
+    word: str, pos: str, rows: list[sqlite3.Row], verb_type: Optional[int] = None
+) -> Optional[WiktionaryResult]:
+    if pos == "verb":
+        conjugations = {row["person"]: row["form"] for row in rows}
         return Verb(
-            type="verb", infinitive=word, verb_type=0, conjugations=conjugations
+            type="verb",
+            infinitive=word,
+            verb_type=verb_type or 0,
+            conjugations=conjugations,
         )
     elif pos == "noun":
-        cursor.execute(
-            "SELECT case_name, singular, plural FROM noun_declensions WHERE word_id = ?",
-            (word_id,),
-        )
         declensions = {
             row["case_name"]: {"singular": row["singular"], "plural": row["plural"]}
-            for row in cursor.fetchall()
+            for row in rows
         }
-        conn.close()
         return Noun(type="noun", word=word, declensions=declensions)
-    conn.close()
-    return None
\ No newline at end of file
+    return None
+
+
+def _result_from_card(word: str, card: str) -> WiktionaryResult:
+    data = json.loads(card)
+    if data["type"] == "verb":
+        return Verb(
+            type="verb",
+            infinitive=word,
+            verb_type=data["verb_type"] or 0,
+            conjugations=data["forms"],
+        )
+    return Noun(type="noun", word=word, declensions=data["forms"])
+
+
+def _read_cards(
+    conn: sqlite3.Connection,
+    words: list[str],
+    results: dict[str, Optional[WiktionaryResult]],
+) -> list[str]:
+    """Fill ``results`` from word cards and return the words that had none."""
+    placeholders = ",".join("?" * len(words))
+    try:
+        cards = conn.execute(
+            f"SELECT word, card FROM word_cards WHERE word IN ({placeholders})", words
+        ).fetchall()
+    except sqlite3.OperationalError as e:
+        if not _is_missing_table(e):
+            raise
+        # The database predates word cards.
+        return words
+    for row in cards:
+        results[row["word"]] = _result_from_card(row["word"], row["card"])
+    return [word for word in words if results[word] is None]
+
+
+def _read_words_details(
+    conn: sqlite3.Connection, words: list[str]
+) -> dict[str, Optional[WiktionaryResult]]:
+    """Read words from their cards, falling back to the relational tables.
+
+    Words whose card is missing (e.g. still being rebuilt) are assembled from
+    ``words``, ``verb_conjugations`` and ``noun_declensions``.
+    """
+    results: dict[str, Optional[WiktionaryResult]] = dict.fromkeys(words)
+    words = _read_cards(conn, words, results)
+    if not words:
+        return results
+    placeholders = ",".join("?" * len(words))
+    entries = conn.execute(
+        f"SELECT * FROM words WHERE word IN ({placeholders})", words
+    ).fetchall()
+    rows: dict[int, list[sqlite3.Row]] = {entry["id"]: [] for entry in entries}
+    for pos, query in (
+        ("verb", "SELECT word_id, person, form FROM verb_conjugations"),
+        ("noun", "SELECT word_id, case_name, singular, plural FROM noun_declensions"),
+    ):
+        ids = [entry["id"] for entry in entries if entry["pos"] == pos]
+        if not ids:
+            continue
+        placeholders = ",".join("?" * len(ids))
+        for row in conn.execute(f"{query} WHERE word_id IN ({placeholders})", ids):
+            rows[row["word_id"]].append(row)
+    for entry in entries:
+        verb_type = entry["verb_type"] if "verb_type" in entry.keys() else None
+        results[entry["word"]] = _make_result(
+            entry["word"], entry["pos"], rows[entry["id"]], verb_type
+        )
+    return results
@@ -4,8 +4,23 @@ import json
 import sqlite3
 import logging
 import argparse
+import hashlib
+import os
+import queue
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
-import time
+from app.utils.compression import MAGIC_BYTES, open_input, open_output
+from app.utils.db_finalize import finalize_database
+from app.utils.jsonl_prefilter import make_line_filter, verify_line_filter
+from app.utils.import_progress import ProgressTracker, print_progress
+from app.utils.import_checkpoint import (
+    ensure_checkpoint_table,
+    load_checkpoint,
+    save_checkpoint,
+)
 
 logging.basicConfig(level=logging.INFO)
 DOWNLOAD_URL = (
@@ -14,17 +29,104 @@ DOWNLOAD_URL = (
 DATA_DIR = Path(".web")
 DB_FILE = DATA_DIR / "finnish_dictionary.db"
 JSONL_FILE = DATA_DIR / "kaikki.org-dictionary-Finnish.jsonl"
+DEFAULT_BATCH_SIZE = 10000
+# Lines between progress updates; a file position is not free to read.
+PROGRESS_EVERY_LINES = 1000
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = httpx.Timeout(60.0)
+DOWNLOAD_RETRIES = 3
+INDEX_STATEMENTS = {
+    "idx_word": "CREATE INDEX IF NOT EXISTS idx_word ON words (word);",
+    "idx_pos": "CREATE INDEX IF NOT EXISTS idx_pos ON words (pos);",
+    "idx_lang_code": "CREATE INDEX IF NOT EXISTS idx_lang_code ON translations (language_code);",
+    "idx_translation": "CREATE INDEX IF NOT EXISTS idx_translation ON translations (translation);",
+    "idx_verb_conjugations_word": "CREATE INDEX IF NOT EXISTS idx_verb_conjugations_word ON verb_conjugations (word_id);",
+    "idx_noun_declensions_word": "CREATE INDEX IF NOT EXISTS idx_noun_declensions_word ON noun_declensions (word_id);",
+    "idx_translations_word": "CREATE INDEX IF NOT EXISTS idx_translations_word ON translations (word_id);",
+    "idx_word_forms_form": "CREATE INDEX IF NOT EXISTS idx_word_forms_form ON word_forms (form);",
+}
+# Kaikki "forms" entries that describe the inflection table, not a word form.
+META_FORM_TAGS = {"table-tags", "inflection-template", "class"}
+# Kotus conjugation type of each model verb named by Wiktionary's
+# fi-conj-<model> templates (the number the Wiktionary tables show).
+KOTUS_VERB_TYPES = {
+    "sanoa": 52,
+    "muistaa": 53,
+    "huutaa": 54,
+    "soutaa": 55,
+    "kaivaa": 56,
+    "saartaa": 57,
+    "laskea": 58,
+    "tuntea": 59,
+    "lähteä": 60,
+    "sallia": 61,
+    "voida": 62,
+    "saada": 63,
+    "juoda": 64,
+    "käydä": 65,
+    "rohkaista": 66,
+    "tulla": 67,
+    "tupakoida": 68,
+    "valita": 69,
+    "juosta": 70,
+    "nähdä": 71,
+    "vanheta": 72,
+    "salata": 73,
+    "katketa": 74,
+    "selvitä": 75,
+    "taitaa": 76,
+    "kumajaa": 77,
+    "kaikaa": 78,
+}
+CARD_GLOSSES = 3
+# One JSON document per verb or noun with everything a lookup shows, so a
+# lookup is a single primary-key read. Keys of "forms" keep row order.
+CARD_SELECT = f"""
+    SELECT w.word, json_object(
+        'type', w.pos,
+        'verb_type', w.verb_type,
+        'forms', CASE w.pos
+            WHEN 'verb' THEN json((
+                SELECT json_group_object(person, form)
+                FROM verb_conjugations WHERE word_id = w.id
+            ))
+            ELSE json((
+                SELECT json_group_object(
+                    case_name, json_object('singular', singular, 'plural', plural)
+                )
+                FROM noun_declensions WHERE word_id = w.id
+            ))
+        END,
+        'glosses', json((
+            SELECT json_group_array(translation) FROM (
+                SELECT translation FROM translations
+                WHERE word_id = w.id AND language_code = 'en'
+                ORDER BY id LIMIT {CARD_GLOSSES}
+            )
+        )),
+        'rank', (SELECT rank FROM word_ranks WHERE word = w.word)
+    )
+    FROM words w
+    WHERE w.pos IN ('verb', 'noun')
+"""
+LINE_FILTER = make_line_filter(["verb", "noun"], lang_code="fi")
 
 
-def init_db():
-    DATA_DIR.mkdir(exist_ok=True)
-    conn = sqlite3.connect(DB_FILE)
+def _is_importable(entry):
+    return entry.get("lang_code") == "fi" and entry.get("pos") in ["verb", "noun"]
+
+
+def init_db(create_indexes=True, db_file=None):
+    db_file = Path(db_file) if db_file is not None else DB_FILE
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_file)
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS words (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             word TEXT NOT NULL UNIQUE,
-            pos TEXT NOT NULL
+            pos TEXT NOT NULL,
+            verb_type INTEGER
         )
     """)
     cursor.execute("""
@@ -54,114 +156,885 @@ def init_db():
             FOREIGN KEY(word_id) REFERENCES words(id)
         )
     """)
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_word ON words (word);")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pos ON words (pos);")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS word_forms (
+            form TEXT NOT NULL,
+            word_id INTEGER NOT NULL,
+            tags TEXT NOT NULL,
+            FOREIGN KEY(word_id) REFERENCES words(id)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS word_ranks (
+            word TEXT PRIMARY KEY,
+            rank INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS word_cards (
+            word TEXT PRIMARY KEY,
+            card TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+    if create_indexes:
+        _create_indexes(cursor)
+    conn.commit()
+    conn.close()
+
+
+def _create_indexes(cursor):
+    for statement in INDEX_STATEMENTS.values():
+        cursor.execute(statement)
+
+
+def _drop_indexes(cursor):
+    for name in INDEX_STATEMENTS:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _card_triggers():
+    """Statements that keep ``word_cards`` in step with the rows it is built from."""
+    refresh = "INSERT OR REPLACE INTO word_cards (word, card) " + CARD_SELECT
+    statements = {}
+    for table in ("verb_conjugations", "noun_declensions", "translations"):
+        for event, rows in (
+            ("insert", ["NEW"]),
+            ("delete", ["OLD"]),
+            ("update", ["OLD", "NEW"]),
+        ):
+            body = "".join(f"{refresh} AND w.id = {row}.word_id;\n" for row in rows)
+            statements[f"trg_cards_{table}_{event}"] = (
+                f"CREATE TRIGGER IF NOT EXISTS trg_cards_{table}_{event} "
+                f"AFTER {event.upper()} ON {table} BEGIN\n{body}END;"
+            )
+    statements["trg_cards_words_insert"] = (
+        "CREATE TRIGGER IF NOT EXISTS trg_cards_words_insert AFTER INSERT ON words "
+        f"BEGIN\n{refresh} AND w.id = NEW.id;\nEND;"
+    )
+    statements["trg_cards_words_update"] = (
+        "CREATE TRIGGER IF NOT EXISTS trg_cards_words_update AFTER UPDATE ON words "
+        "BEGIN\nDELETE FROM word_cards WHERE word = OLD.word;\n"
+        f"{refresh} AND w.id = NEW.id;\nEND;"
+    )
+    statements["trg_cards_words_delete"] = (
+        "CREATE TRIGGER IF NOT EXISTS trg_cards_words_delete AFTER DELETE ON words "
+        "BEGIN\nDELETE FROM word_cards WHERE word = OLD.word;\nEND;"
+    )
+    for event, row in (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD")):
+        statements[f"trg_cards_word_ranks_{event}"] = (
+            f"CREATE TRIGGER IF NOT EXISTS trg_cards_word_ranks_{event} "
+            f"AFTER {event.upper()} ON word_ranks BEGIN\n"
+            f"{refresh} AND w.word = {row}.word;\nEND;"
+        )
+    return statements
+
+
+CARD_TRIGGERS = _card_triggers()
+
+
+def _drop_card_triggers(cursor):
+    for name in CARD_TRIGGERS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+# Full-text index over translations for English -> Finnish search. It is an
+# external-content table, so it stores only the index and reads the text
+# from translations; the porter stemmer lets "speaking" match "speak".
+SEARCH_TABLE = """
+    CREATE VIRTUAL TABLE translation_search USING fts5(
+        translation,
+        content = 'translations',
+        content_rowid = 'id',
+        tokenize = 'porter unicode61 remove_diacritics 2'
+    )
+"""
+SEARCH_TRIGGERS = {
+    "trg_search_insert": """
+        CREATE TRIGGER IF NOT EXISTS trg_search_insert AFTER INSERT ON translations BEGIN
+            INSERT INTO translation_search (rowid, translation)
+            VALUES (NEW.id, NEW.translation);
+        END;
+    """,
+    "trg_search_delete": """
+        CREATE TRIGGER IF NOT EXISTS trg_search_delete AFTER DELETE ON translations BEGIN
+            INSERT INTO translation_search (translation_search, rowid, translation)
+            VALUES ('delete', OLD.id, OLD.translation);
+        END;
+    """,
+    "trg_search_update": """
+        CREATE TRIGGER IF NOT EXISTS trg_search_update AFTER UPDATE ON translations BEGIN
+            INSERT INTO translation_search (translation_search, rowid, translation)
+            VALUES ('delete', OLD.id, OLD.translation);
+            INSERT INTO translation_search (rowid, translation)
+            VALUES (NEW.id, NEW.translation);
+        END;
+    """,
+}
+
+
+def _drop_search_triggers(cursor):
+    for name in SEARCH_TRIGGERS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def build_translation_search(conn):
+    """(Re)build the full-text index over translations and its triggers."""
+    cursor = conn.cursor()
+    _drop_search_triggers(cursor)
+    cursor.execute("DROP TABLE IF EXISTS translation_search")
+    cursor.execute(SEARCH_TABLE)
     cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_lang_code ON translations (language_code);"
+        "INSERT INTO translation_search (translation_search) VALUES ('rebuild')"
     )
     cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_translation ON translations (translation);"
+        "INSERT INTO translation_search (translation_search) VALUES ('optimize')"
     )
+    for statement in SEARCH_TRIGGERS.values():
+        cursor.execute(statement)
     conn.commit()
-    conn.close()
 
 
-def download_dictionary():
-    logging.info(f"Starting download from {DOWNLOAD_URL}")
-    DATA_DIR.mkdir(exist_ok=True)
+def _load_ranks(path):
+    """Rank words by their order in a frequency list, most frequent first.
+
+    Each line starts with a word; anything after it, such as a count, is
+    ignored. A word listed twice keeps its first rank.
+    """
+    ranks = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if fields:
+                ranks.setdefault(fields[0], len(ranks) + 1)
+    return ranks
+
+
+def build_word_cards(conn, ranks=None):
+    """(Re)build every word card and the triggers that refresh them.
+
+    Run it once the rows and indexes are in place; while the triggers exist,
+    each change to a word's rows rebuilds that word's card.
+    """
+    cursor = conn.cursor()
+    _drop_card_triggers(cursor)
+    cursor.execute("DELETE FROM word_ranks")
+    cursor.executemany(
+        "INSERT INTO word_ranks (word, rank) VALUES (?, ?)",
+        (ranks or {}).items(),
+    )
+    cursor.execute("DELETE FROM word_cards")
+    cursor.execute("INSERT INTO word_cards (word, card) " + CARD_SELECT)
+    for statement in CARD_TRIGGERS.values():
+        cursor.execute(statement)
+    conn.commit()
+    return cursor.execute("SELECT COUNT(*) FROM word_cards").fetchone()[0]
+
+
+class DownloadStatus(Enum):
+    DOWNLOADED = "downloaded"
+    NOT_MODIFIED = "not-modified"
+    FAILED = "failed"
+
+
+def _part_size(path):
+    return path.stat().st_size if path.exists() else 0
+
+
+def _fetch_range(client, url, path, on_bytes, start=0, end=None):
+    """Download bytes ``start``..``end`` of ``url`` into ``path``.
+
+    Whatever ``path`` already holds is kept and only the rest is requested
+    with a ``Range`` header. ``end=None`` means up to the end of the file;
+    in that case a server that ignores ``Range`` restarts the file from zero.
+    """
+    have = _part_size(path)
+    if end is not None and have >= end - start + 1:
+        return
+    headers = {}
+    if start + have > 0 or end is not None:
+        last = "" if end is None else str(end)
+        headers["Range"] = f"bytes={start + have}-{last}"
+    with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 416 and end is None:
+            total = response.headers.get("content-range", "").rpartition("/")[2]
+            if total.isdigit() and int(total) == have:
+                return
+            path.unlink()
+            raise httpx.HTTPError(f"{path} does not match the remote file")
+        response.raise_for_status()
+        mode = "ab"
+        if headers and response.status_code != 206:
+            if end is not None:
+                raise httpx.HTTPError(f"{url} ignored the Range header")
+            mode = "wb"
+        with open(path, mode) as f:
+            for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                on_bytes(len(chunk))
+
+
+def _probe(client, url, headers=None):
+    """``HEAD`` the dump; returns the response, which may be a 304."""
+    response = client.head(url, headers=headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+def _validators(response):
+    """The cache validators of a response, as stored in the metadata file."""
+    return {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "content_length": int(response.headers.get("content-length", 0)),
+    }
+
+
+def _conditional_headers(meta):
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _meta_path(path):
+    return path.with_name(path.name + ".meta.json")
+
+
+def _read_meta(path):
     try:
-        with httpx.stream("GET", DOWNLOAD_URL, timeout=None) as response:
-            response.raise_for_status()
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded_size = 0
-            start_time = time.time()
-            with open(JSONL_FILE, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded_size += len(chunk)
-                    elapsed_time = time.time() - start_time
-                    if elapsed_time > 1:
-                        progress = (
-                            downloaded_size / total_size * 100 if total_size > 0 else 0
-                        )
-                        speed = downloaded_size / elapsed_time / (1024 * 1024)
-                        print(
-                            f"\rDownloading: {downloaded_size / 1024 / 1024:.2f}MB / {total_size / 1024 / 1024:.2f}MB ({progress:.1f}%) at {speed:.2f} MB/s",
-                            end="",
-                        )
-            print("""
-Download complete.""")
-    except httpx.RequestError as e:
-        logging.exception(f"Download failed: {e}")
+        return json.loads(_meta_path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
 
-def import_to_sqlite():
-    if not JSONL_FILE.exists():
+def _write_meta(path, meta):
+    _meta_path(path).write_text(json.dumps(meta, indent=2))
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dump_path(dest=JSONL_FILE, compression=None):
+    dest = Path(dest)
+    if compression is None:
+        return dest
+    return dest.with_name(f"{dest.name}.{compression}")
+
+
+def _find_dump():
+    """Return the downloaded dump, preferring the plain file to compressed ones."""
+    for compression in (None, *MAGIC_BYTES):
+        path = _dump_path(JSONL_FILE, compression)
+        if path.exists():
+            return path
+    return JSONL_FILE
+
+
+def _compress(source, dest, compression):
+    tmp = dest.with_name(dest.name + ".tmp")
+    with open(source, "rb") as f, open_output(tmp, compression) as out:
+        shutil.copyfileobj(f, out, DOWNLOAD_CHUNK_SIZE)
+    os.replace(tmp, dest)
+    source.unlink()
+
+
+def download_dictionary(
+    url=DOWNLOAD_URL,
+    dest=JSONL_FILE,
+    segments=1,
+    sha256=None,
+    retries=DOWNLOAD_RETRIES,
+    progress=print_progress,
+    compression=None,
+):
+    """Download ``url`` to ``dest`` through a resumable ``.part`` file.
+
+    An interrupted download continues from the bytes already on disk. With
+    ``segments > 1`` and a server that supports ranges, the file is fetched as
+    that many parallel ranges, each resumable on its own. The SHA-256 of the
+    result is written next to it and, when ``sha256`` is given, must match.
+
+    The response's ``ETag``/``Last-Modified``/``Content-Length`` are stored in
+    ``<dest>.meta.json``. If ``dest`` exists, they are sent back as
+    ``If-None-Match``/``If-Modified-Since`` and a 304 skips the download.
+    Partial files are discarded if the remote validators, or the segments the
+    file is split into, no longer match the ones they were started with.
+
+    With ``compression`` (``"gz"``, ``"xz"`` or ``"zst"``) the verified dump
+    is stored compressed as ``<dest>.<compression>``; the importers read it
+    directly.
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    final = _dump_path(dest, compression)
+    part = dest.with_name(dest.name + ".part")
+    logging.info(f"Starting download from {url}")
+    with httpx.Client(timeout=DOWNLOAD_TIMEOUT, follow_redirects=True) as client:
+        headers = _conditional_headers(_read_meta(final)) if final.exists() else {}
+        try:
+            response = _probe(client, url, headers)
+        except httpx.HTTPError as e:
+            logging.exception(f"Download failed: {e}")
+            return DownloadStatus.FAILED
+        if response.status_code == 304:
+            logging.info(f"{final} is up to date with {url}")
+            return DownloadStatus.NOT_MODIFIED
+        validators = _validators(response)
+        size = validators["content_length"]
+        accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        if segments > 1 and not (accepts_ranges and size):
+            logging.info("Server does not support ranges; downloading in one piece")
+            segments = 1
+        if segments > 1:
+            bounds = [
+                (i * size // segments, (i + 1) * size // segments - 1)
+                for i in range(segments)
+            ]
+            pieces = [dest.with_name(f"{dest.name}.part{i}") for i in range(segments)]
+        else:
+            bounds = [(0, None)]
+            pieces = [part]
+        # Pieces are only valid at the offsets they were started with.
+        layout = {
+            **validators,
+            "segments": segments,
+            "ranges": [list(bound) for bound in bounds],
+        }
+        if _read_meta(part) != layout:
+            for stale in dest.parent.glob(f"{dest.name}.part*"):
+                stale.unlink()
+            _write_meta(part, layout)
+        tracker = ProgressTracker(
+            size, progress, sum(map(_part_size, pieces)), label="Downloading"
+        )
+        lock = threading.Lock()
+
+        def on_bytes(count):
+            with lock:
+                tracker.update(tracker.bytes_read + count, 0)
+
+        def fetch(piece, start, end):
+            for attempt in range(retries + 1):
+                try:
+                    _fetch_range(client, url, piece, on_bytes, start, end)
+                    return
+                except httpx.HTTPError as e:
+                    if attempt == retries:
+                        raise
+                    logging.warning(f"Retrying {piece.name} after error: {e}")
+                    with lock:
+                        tracker.bytes_read = sum(map(_part_size, pieces))
+
+        try:
+            with ThreadPoolExecutor(max_workers=segments) as pool:
+                futures = [
+                    pool.submit(fetch, piece, start, end)
+                    for piece, (start, end) in zip(pieces, bounds)
+                ]
+                for future in futures:
+                    future.result()
+        except httpx.HTTPError as e:
+            logging.exception(f"Download failed, rerun to resume: {e}")
+            return DownloadStatus.FAILED
+    tracker.finish()
+    if segments > 1:
+        with open(part, "wb") as out:
+            for piece in pieces:
+                with open(piece, "rb") as f:
+                    shutil.copyfileobj(f, out, DOWNLOAD_CHUNK_SIZE)
+        for piece in pieces:
+            piece.unlink()
+    if size and _part_size(part) != size:
         logging.error(
-            f"{JSONL_FILE} not found. Please download it first with 'python -m app.utils.dictionary_downloader download'"
+            f"Downloaded {_part_size(part)} bytes but expected {size}; rerun to resume"
         )
-        return
-    init_db()
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    total_lines = sum((1 for _ in open(JSONL_FILE, "r", encoding="utf-8")))
-    logging.info(f"Starting import of {total_lines} entries into {DB_FILE}")
-    with open(JSONL_FILE, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            if (i + 1) % 1000 == 0:
-                progress = (i + 1) / total_lines * 100
-                print(
-                    f"\rImporting: {i + 1} / {total_lines} ({progress:.1f}%) entries processed",
-                    end="",
-                )
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError as e:
-                logging.exception(f"Failed to decode JSON line: {line}")
-                continue
-            if entry.get("lang_code") != "fi" or entry.get("pos") not in [
-                "verb",
-                "noun",
-            ]:
-                continue
-            word = entry.get("word")
-            pos = entry.get("pos")
-            cursor.execute("SELECT id FROM words WHERE word = ?", (word,))
-            existing_word = cursor.fetchone()
-            if existing_word:
-                word_id = existing_word[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO words (word, pos) VALUES (?, ?)", (word, pos)
+        return DownloadStatus.FAILED
+    digest = _sha256(part)
+    if sha256 is not None and digest != sha256.lower():
+        logging.error(f"SHA-256 mismatch for {url}: expected {sha256}, got {digest}")
+        part.unlink()
+        _meta_path(part).unlink()
+        return DownloadStatus.FAILED
+    if compression is None:
+        os.replace(part, dest)
+        dest.with_name(dest.name + ".sha256").write_text(f"{digest}  {dest.name}\n")
+    else:
+        logging.info(f"Compressing to {final}")
+        _compress(part, final, compression)
+    _write_meta(final, {**validators, "url": url, "sha256": digest})
+    _meta_path(part).unlink()
+    logging.info(f"Download complete. SHA-256 {digest}")
+    return DownloadStatus.DOWNLOADED
+
+
+class BulkLoader:
+    """Buffer rows per table and write them with ``executemany`` in batches.
+
+    Word ids are resolved from an in-memory map seeded from the existing
+    ``words`` table, so no ``SELECT`` is needed per entry. Committing is left
+    to the caller so each batch can be committed with its checkpoint.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.word_ids = dict(conn.execute("SELECT word, id FROM words"))
+        self.next_word_id = max(self.word_ids.values(), default=0) + 1
+        self.words = []
+        self.translations = []
+        self.conjugations = []
+        self.declensions = []
+        self.forms = []
+        self.pending = 0
+
+    def add_entry(self, entry):
+        word = entry.get("word")
+        pos = entry.get("pos")
+        word_id = self.word_ids.get(word)
+        if word_id is None:
+            word_id = self.next_word_id
+            self.next_word_id += 1
+            self.word_ids[word] = word_id
+            self.words.append((word_id, word, pos, _kotus_verb_type(entry)))
+            self.pending += 1
+        for sense in entry.get("senses", []):
+            for gloss in sense.get("glosses", []):
+                self.translations.append((word_id, "en", gloss, gloss))
+                self.pending += 1
+        forms = entry.get("forms", [])
+        for form, tags in _surface_forms(forms):
+            self.forms.append((form, word_id, tags))
+            self.pending += 1
+        if pos == "verb":
+            for person, form in _parse_verb_forms(forms).items():
+                self.conjugations.append((word_id, person, form))
+                self.pending += 1
+        elif pos == "noun":
+            for case, numbers in _parse_noun_forms(forms).items():
+                self.declensions.append(
+                    (word_id, case, numbers.get("singular"), numbers.get("plural"))
                 )
-                word_id = cursor.lastrowid
-            senses = entry.get("senses", [])
-            for sense in senses:
-                glosses = sense.get("glosses", [])
-                for gloss in glosses:
-                    cursor.execute(
-                        "INSERT INTO translations (word_id, language_code, translation, definition) VALUES (?, ?, ?, ?)",
-                        (word_id, "en", gloss, gloss),
-                    )
-            forms = entry.get("forms", [])
-            if pos == "verb":
-                conjugations = _parse_verb_forms(forms)
-                for person, form in conjugations.items():
-                    cursor.execute(
-                        "INSERT INTO verb_conjugations (word_id, person, form) VALUES (?, ?, ?)",
-                        (word_id, person, form),
-                    )
-            elif pos == "noun":
-                declensions = _parse_noun_forms(forms)
-                for case, numbers in declensions.items():
-                    cursor.execute(
-                        "INSERT INTO noun_declensions (word_id, case_name, singular, plural) VALUES (?, ?, ?, ?)",
-                        (word_id, case, numbers.get("singular"), numbers.get("plural")),
-                    )
+                self.pending += 1
+
+    def flush(self):
+        """Write the buffered rows and return how many went into each table."""
+        counts = {
+            "words": len(self.words),
+            "translations": len(self.translations),
+            "verb_conjugations": len(self.conjugations),
+            "noun_declensions": len(self.declensions),
+            "word_forms": len(self.forms),
+        }
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "INSERT INTO words (id, word, pos, verb_type) VALUES (?, ?, ?, ?)",
+            self.words,
+        )
+        cursor.executemany(
+            "INSERT INTO translations (word_id, language_code, translation, definition) VALUES (?, ?, ?, ?)",
+            self.translations,
+        )
+        cursor.executemany(
+            "INSERT INTO verb_conjugations (word_id, person, form) VALUES (?, ?, ?)",
+            self.conjugations,
+        )
+        cursor.executemany(
+            "INSERT INTO noun_declensions (word_id, case_name, singular, plural) VALUES (?, ?, ?, ?)",
+            self.declensions,
+        )
+        cursor.executemany(
+            "INSERT INTO word_forms (form, word_id, tags) VALUES (?, ?, ?)",
+            self.forms,
+        )
+        self.words.clear()
+        self.translations.clear()
+        self.conjugations.clear()
+        self.declensions.clear()
+        self.forms.clear()
+        self.pending = 0
+        return counts
+
+
+def _open_import_db(db_file=None):
+    db_file = db_file if db_file is not None else DB_FILE
+    init_db(create_indexes=False, db_file=db_file)
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    ensure_checkpoint_table(conn)
+    _drop_indexes(conn.cursor())
+    _drop_card_triggers(conn.cursor())
+    _drop_search_triggers(conn.cursor())
+    return conn
+
+
+def _load_lines(
+    conn,
+    lines,
+    tracker,
+    batch_size,
+    prefilter,
+    source=None,
+    byte_offset=0,
+    lines_read=0,
+    position=None,
+):
+    """Import raw JSONL lines, committing every batch.
+
+    When ``source`` is a file the commits also record a checkpoint for it.
+    ``position``, if given, returns the offset progress is reported at, for
+    compressed sources whose size is not the decompressed one.
+    Returns the byte offset and line count reached.
+    """
+    loader = BulkLoader(conn)
+    for line in lines:
+        byte_offset += len(line)
+        lines_read += 1
+        if lines_read % PROGRESS_EVERY_LINES == 0:
+            tracker.update(position() if position else byte_offset, lines_read)
+        if prefilter and not LINE_FILTER(line):
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            logging.exception(f"Failed to decode JSON line: {line}")
+            continue
+        if not _is_importable(entry):
+            continue
+        loader.add_entry(entry)
+        if loader.pending >= batch_size:
+            tracker.add_rows(loader.flush())
+            if source is not None:
+                save_checkpoint(conn, source, byte_offset, lines_read)
+            conn.commit()
+    tracker.add_rows(loader.flush())
+    if source is not None:
+        save_checkpoint(conn, source, byte_offset, lines_read)
+    conn.commit()
+    tracker.update(position() if position else byte_offset, lines_read)
+    tracker.finish()
+    return byte_offset, lines_read
+
+
+def _finish_import(conn, ranks=None):
+    logging.info("Building indexes...")
+    _create_indexes(conn.cursor())
+    conn.commit()
+    if ranks:
+        logging.info(f"Ranking words by a frequency list of {len(ranks)} words")
+    else:
+        logging.info("No frequency list given; words are not ranked")
+    logging.info("Building word cards...")
+    cards = build_word_cards(conn, ranks)
+    logging.info(f"Built {cards} word cards")
+    logging.info("Building the translation search index...")
+    build_translation_search(conn)
+
+
+def _build_path(db_file=None):
+    """Where a new database is built before it replaces ``db_file``."""
+    db_file = Path(db_file) if db_file is not None else DB_FILE
+    return db_file.with_name(db_file.name + ".build")
+
+
+def _remove_db(path):
+    for name in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+        name.unlink(missing_ok=True)
+
+
+def _validate_build(path):
+    conn = sqlite3.connect(path)
+    try:
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        words = conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+    finally:
+        conn.close()
+    if result != "ok":
+        raise sqlite3.DatabaseError(f"{path} failed quick_check: {result}")
+    if not words:
+        raise sqlite3.DatabaseError(f"{path} holds no words")
+
+
+def _install_build(build, db_file=None, finalize=False, meta=None):
+    """Validate a finished build and atomically rename it over ``db_file``.
+
+    The live database is never written in place: readers that already have
+    it open keep reading the old file, new connections get the new one. The
+    build is switched to rollback-journal mode first, because a WAL left by
+    readers of the old file would otherwise be replayed onto the new one.
+
+    ``meta`` replaces the validators stored next to ``db_file``; without it
+    they are removed, since they described the database being replaced.
+    """
+    db_file = Path(db_file) if db_file is not None else DB_FILE
+    _validate_build(build)
+    _meta_path(db_file).unlink(missing_ok=True)
+    if finalize:
+        logging.info(f"Finalizing {build}...")
+        finalize_database(build, output=db_file)
+        _remove_db(build)
+    else:
+        conn = sqlite3.connect(build)
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.close()
+        os.replace(build, db_file)
+    if meta is not None:
+        _write_meta(db_file, meta)
+    logging.info(f"Installed the new dictionary at {db_file}")
+
+
+def _completed_import(source, db_file=None):
+    """True if ``db_file`` already holds a completed import of ``source``."""
+    db_file = Path(db_file) if db_file is not None else DB_FILE
+    if not db_file.exists():
+        return False
+    conn = sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        checkpoint = load_checkpoint(conn, source)
+    except ValueError:
+        # Written for an earlier dump, so the current one is not imported yet.
+        return False
+    finally:
+        conn.close()
+    return checkpoint is not None and checkpoint.completed
+
+
+def import_to_sqlite(
+    batch_size=DEFAULT_BATCH_SIZE,
+    prefilter=True,
+    verify_sample=0,
+    resume=False,
+    progress=print_progress,
+    source=None,
+    finalize=False,
+    frequency_list=None,
+):
+    """Import the downloaded dump, plain or gzip/xz/zstd compressed.
+
+    ``source`` defaults to whichever of ``JSONL_FILE`` and its compressed
+    variants exists. The database is built next to ``DB_FILE`` and swapped
+    in once it validates, so a running app never sees a partial import;
+    ``resume`` continues an interrupted build. ``finalize`` compacts the
+    build into a read-only artifact before the swap (see ``db_finalize``).
+    ``frequency_list`` is a word-frequency file (see ``_load_ranks``) that
+    ranks the words; without one they are not ranked.
+    """
+    source = Path(source) if source is not None else _find_dump()
+    if not source.exists():
+        logging.error(
+            f"{source} not found. Please download it first with 'python -m app.utils.dictionary_downloader download'"
+        )
+        return
+    ranks = _load_ranks(frequency_list) if frequency_list is not None else {}
+    if prefilter and verify_sample:
+        stats = verify_line_filter(source, LINE_FILTER, _is_importable, verify_sample)
+        logging.info(
+            f"Pre-filter check passed: {stats['candidates']} of {stats['sampled']} sampled lines decoded, {stats['false_positives']} false positives"
+        )
+    if resume and _completed_import(source):
+        logging.info(f"{DB_FILE} already holds a completed import of {source}")
+        return
+    build = _build_path()
+    if not resume:
+        _remove_db(build)
+    conn = _open_import_db(build)
+    byte_offset = 0
+    lines_read = 0
+    if resume:
+        checkpoint = load_checkpoint(conn, source)
+        if checkpoint:
+            byte_offset = checkpoint.byte_offset
+            lines_read = checkpoint.entries
+            logging.info(
+                f"Resuming import at byte {byte_offset} after {lines_read} entries"
+            )
+    logging.info(f"Starting import of {source} into {build} (batch size {batch_size})")
+    with open_input(source) as f:
+        f.seek(byte_offset)
+        tracker = ProgressTracker(source.stat().st_size, progress, f.raw_position)
+        byte_offset, lines_read = _load_lines(
+            conn,
+            f,
+            tracker,
+            batch_size,
+            prefilter,
+            source=source,
+            byte_offset=byte_offset,
+            lines_read=lines_read,
+            position=lambda: f.raw_position,
+        )
+    _finish_import(conn, ranks)
+    save_checkpoint(conn, source, byte_offset, lines_read, completed=True)
     conn.commit()
     conn.close()
-    print("""
-Import complete.""")
+    logging.info("Import complete.")
+    _install_build(build, finalize=finalize)
+
+
+def _iter_lines(chunks):
+    """Split a stream of byte chunks into lines, keeping the line endings."""
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + b"\n"
+    if pending:
+        yield pending
+
+
+def _prefetch(iterable, maxsize=64):
+    """Iterate ``iterable`` on a background thread so I/O overlaps parsing."""
+    items = queue.Queue(maxsize=maxsize)
+    done = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                items.put(item)
+        except BaseException as e:
+            items.put(e)
+        items.put(done)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        item = items.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def _tee(chunks, path):
+    """Write every chunk to ``path`` as it passes, compressed by its suffix."""
+    with open_output(path) as f:
+        for chunk in chunks:
+            f.write(chunk)
+            yield chunk
+
+
+def download_and_import(
+    url=DOWNLOAD_URL,
+    tee_path=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    prefilter=True,
+    progress=print_progress,
+    finalize=False,
+    frequency_list=None,
+):
+    """Import the dump while it downloads, without staging it on disk first.
+
+    The response is read on a background thread and split into lines that go
+    straight into the bulk loader. ``tee_path`` optionally keeps a copy of the
+    raw bytes. A streamed import cannot be resumed; use ``download`` and
+    ``import --resume`` where that matters.
+
+    The validators of the imported response are stored next to the database,
+    and a later run whose conditional request gets a 304 imports nothing.
+    Like ``import_to_sqlite``, the database is built aside and swapped in,
+    and ``frequency_list`` ranks its words.
+    """
+    ranks = _load_ranks(frequency_list) if frequency_list is not None else {}
+    headers = _conditional_headers(_read_meta(DB_FILE)) if DB_FILE.exists() else {}
+    build = _build_path()
+    conn = None
+    try:
+        with httpx.stream(
+            "GET", url, headers=headers, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            if response.status_code == 304:
+                logging.info(f"{DB_FILE} is up to date with {url}")
+                return DownloadStatus.NOT_MODIFIED
+            response.raise_for_status()
+            _remove_db(build)
+            conn = _open_import_db(build)
+            logging.info(f"Streaming {url} into {build} (batch size {batch_size})")
+            validators = _validators(response)
+            total_size = int(response.headers.get("content-length", 0))
+            tracker = ProgressTracker(total_size, progress)
+            chunks = response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE)
+            if tee_path is not None:
+                chunks = _tee(chunks, Path(tee_path))
+            _load_lines(
+                conn,
+                _iter_lines(_prefetch(chunks)),
+                tracker,
+                batch_size,
+                prefilter,
+            )
+    except httpx.HTTPError as e:
+        logging.exception(f"Download failed: {e}")
+        if conn is not None:
+            conn.close()
+            _remove_db(build)
+        return DownloadStatus.FAILED
+    _finish_import(conn, ranks)
+    conn.close()
+    logging.info("Import complete.")
+    _install_build(build, finalize=finalize, meta={**validators, "url": url})
+    return DownloadStatus.DOWNLOADED
+
+
+def update_dictionary(
+    url=DOWNLOAD_URL,
+    segments=1,
+    batch_size=DEFAULT_BATCH_SIZE,
+    compression=None,
+    finalize=False,
+    frequency_list=None,
+):
+    """Download the dump if it changed and import it if it has not been yet.
+
+    A 304 skips the import as well, unless the last import of the current
+    file never completed, in which case it is resumed.
+    """
+    source = _dump_path(JSONL_FILE, compression)
+    status = download_dictionary(url=url, segments=segments, compression=compression)
+    if status is DownloadStatus.FAILED:
+        return status
+    if status is DownloadStatus.NOT_MODIFIED and _completed_import(source):
+        logging.info("Dictionary unchanged; skipping import")
+        return status
+    import_to_sqlite(
+        batch_size=batch_size,
+        resume=status is DownloadStatus.NOT_MODIFIED,
+        source=source,
+        finalize=finalize,
+        frequency_list=frequency_list,
+    )
+    return status
+
+
+def _kotus_verb_type(entry):
+    if entry.get("pos") != "verb":
+        return None
+    for template in entry.get("inflection_templates") or []:
+        name = template.get("name", "")
+        if name.startswith("fi-conj-"):
+            return KOTUS_VERB_TYPES.get(name.removeprefix("fi-conj-"))
+    return None
+
+
+def _surface_forms(forms):
+    """Distinct (form, space-separated tags) pairs of an entry's inflected forms."""
+    seen = set()
+    for form_entry in forms:
+        form = form_entry.get("form")
+        tags = form_entry.get("tags") or []
+        if not form or form == "-" or META_FORM_TAGS.intersection(tags):
+            continue
+        key = (form, " ".join(tags))
+        if key not in seen:
+            seen.add(key)
+            yield key
 
 
 def _parse_verb_forms(forms):
@@ -222,11 +1095,168 @@ if __name__ == "__main__":
     download_parser = subparsers.add_parser(
         "download", help="Download the dictionary file."
     )
+    download_parser.add_argument("--url", default=DOWNLOAD_URL)
+    download_parser.add_argument(
+        "--segments",
+        type=int,
+        default=1,
+        help="Download this many byte ranges in parallel if the server supports it.",
+    )
+    download_parser.add_argument(
+        "--sha256",
+        default=None,
+        help="Expected SHA-256 of the dump; the download fails if it differs.",
+    )
+    download_parser.add_argument(
+        "--compress",
+        choices=sorted(MAGIC_BYTES),
+        default=None,
+        help="Store the downloaded dump compressed in this format.",
+    )
     import_parser = subparsers.add_parser(
         "import", help="Import the dictionary into SQLite."
     )
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of buffered rows to write per executemany batch.",
+    )
+    import_parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Decode every line instead of skipping non-noun/verb lines by their raw bytes.",
+    )
+    import_parser.add_argument(
+        "--verify-prefilter",
+        type=int,
+        default=0,
+        metavar="SAMPLE",
+        help="Check the byte pre-filter against a full decode of the first SAMPLE lines before importing.",
+    )
+    import_parser.add_argument(
+        "--input",
+        type=Path,
+        default=None,
+        help="Dump to import (plain, .gz, .xz or .zst); defaults to the downloaded one.",
+    )
+    import_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted import from its last committed checkpoint.",
+    )
+    import_parser.add_argument(
+        "--finalize",
+        action="store_true",
+        help="Analyze and compact the database into a read-only artifact afterwards.",
+    )
+    import_parser.add_argument(
+        "--frequency-list",
+        type=Path,
+        default=None,
+        help="Word-frequency list to rank words by: one word per line, most frequent first, optionally followed by a count.",
+    )
+    stream_parser = subparsers.add_parser(
+        "download-and-import",
+        help="Stream the dictionary straight into SQLite while downloading.",
+    )
+    stream_parser.add_argument("--url", default=DOWNLOAD_URL)
+    stream_parser.add_argument(
+        "--tee",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Also write the raw dump to PATH (compressed if it ends in .gz, .xz or .zst).",
+    )
+    stream_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of buffered rows to write per executemany batch.",
+    )
+    stream_parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Decode every line instead of skipping non-noun/verb lines by their raw bytes.",
+    )
+    stream_parser.add_argument(
+        "--finalize",
+        action="store_true",
+        help="Analyze and compact the database into a read-only artifact afterwards.",
+    )
+    stream_parser.add_argument(
+        "--frequency-list",
+        type=Path,
+        default=None,
+        help="Word-frequency list to rank words by: one word per line, most frequent first, optionally followed by a count.",
+    )
+    update_parser = subparsers.add_parser(
+        "update",
+        help="Download and import only if the dictionary changed since the last run.",
+    )
+    update_parser.add_argument("--url", default=DOWNLOAD_URL)
+    update_parser.add_argument(
+        "--segments",
+        type=int,
+        default=1,
+        help="Download this many byte ranges in parallel if the server supports it.",
+    )
+    update_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of buffered rows to write per executemany batch.",
+    )
+    update_parser.add_argument(
+        "--compress",
+        choices=sorted(MAGIC_BYTES),
+        default=None,
+        help="Store the downloaded dump compressed in this format.",
+    )
+    update_parser.add_argument(
+        "--finalize",
+        action="store_true",
+        help="Analyze and compact the database into a read-only artifact after importing.",
+    )
+    update_parser.add_argument(
+        "--frequency-list",
+        type=Path,
+        default=None,
+        help="Word-frequency list to rank words by: one word per line, most frequent first, optionally followed by a count.",
+    )
     args = parser.parse_args()
     if args.command == "download":
-        download_dictionary()
+        download_dictionary(
+            url=args.url,
+            segments=args.segments,
+            sha256=args.sha256,
+            compression=args.compress,
+        )
     elif args.command == "import":
-        import_to_sqlite()
\ No newline at end of file
+        import_to_sqlite(
+            batch_size=args.batch_size,
+            prefilter=not args.no_prefilter,
+            verify_sample=args.verify_prefilter,
+            resume=args.resume,
+            source=args.input,
+            finalize=args.finalize,
+            frequency_list=args.frequency_list,
+        )
+    elif args.command == "download-and-import":
+        download_and_import(
+            url=args.url,
+            tee_path=args.tee,
+            batch_size=args.batch_size,
+            prefilter=not args.no_prefilter,
+            finalize=args.finalize,
+            frequency_list=args.frequency_list,
+        )
+    elif args.command == "update":
+        update_dictionary(
+            url=args.url,
+            segments=args.segments,
+            batch_size=args.batch_size,
+            compression=args.compress,
+            finalize=args.finalize,
+            frequency_list=args.frequency_list,
+        )
@@ -0,0 +1,240 @@
+"""Benchmark the dictionary importers on a given or synthetic Kaikki dump.
+
+Each importer runs in a fresh process so its peak RSS is measured on its own.
+The report (entries and rows per second, peak RSS, final database size) is
+written as JSON so runs can be compared over time. ``load_seconds`` is the
+time spent reading the dump and inserting rows; the rest of ``elapsed_seconds``
+goes to building indexes and derived tables afterwards. Run it as a module
+from the repository root::
+
+    python -m app.utils.import_benchmark --entries 50000
+    python -m app.utils.import_benchmark --input fi.jsonl --importers converter
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from app.utils.import_progress import ProgressEvent
+from app.utils.synthetic_kaikki import generate_entries, write_jsonl
+
+IMPORTERS = ("converter", "downloader")
+DEFAULT_OUTPUT_DIR = Path(".web") / "benchmarks"
+
+
+def peak_rss_bytes(who: int = resource.RUSAGE_SELF) -> int:
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS.
+    peak = resource.getrusage(who).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_converter(
+    source: Path, db_path: Path, options: dict[str, Any]
+) -> Optional[ProgressEvent]:
+    from app.utils import convert_fi_jsonl_to_sqlite as converter
+
+    events: list[ProgressEvent] = []
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        converter.init_database(connection)
+        converter.process_entries(
+            source,
+            connection,
+            workers=options["workers"],
+            chunk_size=options["chunk_size"],
+            line_filter=converter.LINE_FILTER if options["prefilter"] else None,
+            progress=events.append,
+        )
+    finally:
+        connection.close()
+    return events[-1] if events else None
+
+
+def run_downloader(
+    source: Path, db_path: Path, options: dict[str, Any]
+) -> Optional[ProgressEvent]:
+    from app.utils import dictionary_downloader as downloader
+
+    events: list[ProgressEvent] = []
+    downloader.DATA_DIR = db_path.parent
+    downloader.DB_FILE = db_path
+    downloader.import_to_sqlite(
+        batch_size=options["batch_size"],
+        prefilter=options["prefilter"],
+        progress=events.append,
+        source=source,
+    )
+    return events[-1] if events else None
+
+
+RUNNERS = {"converter": run_converter, "downloader": run_downloader}
+
+
+def _measure(
+    importer: str,
+    source: Path,
+    db_path: Path,
+    options: dict[str, Any],
+    results: multiprocessing.Queue,
+) -> None:
+    started = time.perf_counter()
+    event = RUNNERS[importer](source, db_path, options)
+    elapsed = time.perf_counter() - started
+    rows = event.rows if event is not None else {}
+    entries = event.entries if event is not None else 0
+    results.put(
+        {
+            "importer": importer,
+            "elapsed_seconds": elapsed,
+            "load_seconds": event.elapsed if event is not None else elapsed,
+            "entries": entries,
+            "entries_per_second": entries / elapsed if elapsed > 0 else 0.0,
+            "rows": rows,
+            "rows_per_second": {
+                table: count / elapsed if elapsed > 0 else 0.0
+                for table, count in rows.items()
+            },
+            "peak_rss_bytes": peak_rss_bytes(),
+            "peak_child_rss_bytes": peak_rss_bytes(resource.RUSAGE_CHILDREN),
+        }
+    )
+
+
+def run_benchmark(
+    importer: str, source: Path, db_path: Path, options: dict[str, Any]
+) -> dict[str, Any]:
+    """Import ``source`` into a fresh ``db_path`` in a child process and report.
+
+    ``entries`` counts the JSON lines read; ``rows`` counts the rows written
+    per table, both taken from the importer's final ``ProgressEvent``.
+    """
+
+    for path in (db_path, *db_path.parent.glob(f"{db_path.name}-*")):
+        path.unlink(missing_ok=True)
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(
+        target=_measure, args=(importer, source, db_path, options, results)
+    )
+    process.start()
+    result = results.get()
+    process.join()
+    if process.exitcode:
+        raise RuntimeError(f"{importer} benchmark exited with {process.exitcode}")
+    result["db_size_bytes"] = sum(
+        path.stat().st_size
+        for path in (db_path, *db_path.parent.glob(f"{db_path.name}-*"))
+    )
+    return result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=None,
+        help="Dump to import; by default a synthetic one is generated.",
+    )
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=20000,
+        help="Size of the generated synthetic dump.",
+    )
+    parser.add_argument(
+        "--foreign-rate",
+        type=float,
+        default=0.1,
+        help="Share of non-Finnish entries in the synthetic dump.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--importers",
+        nargs="+",
+        choices=IMPORTERS,
+        default=list(IMPORTERS),
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--no-prefilter", action="store_true")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="JSON report path (default: .web/benchmarks/import-<timestamp>.json).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    options = {
+        "workers": args.workers,
+        "chunk_size": args.chunk_size,
+        "batch_size": args.batch_size,
+        "prefilter": not args.no_prefilter,
+    }
+    with tempfile.TemporaryDirectory(prefix="import-benchmark-") as workdir:
+        workdir = Path(workdir)
+        source = args.input
+        if source is None:
+            source = workdir / "synthetic.jsonl"
+            write_jsonl(
+                source,
+                generate_entries(
+                    args.entries, seed=args.seed, foreign_rate=args.foreign_rate
+                ),
+            )
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sqlite": sqlite3.sqlite_version,
+            "source": str(args.input) if args.input else "synthetic",
+            "source_bytes": source.stat().st_size,
+            "synthetic_entries": None if args.input else args.entries,
+            "seed": None if args.input else args.seed,
+            "foreign_rate": None if args.input else args.foreign_rate,
+            "options": options,
+            "results": [
+                run_benchmark(importer, source, workdir / f"{importer}.db", options)
+                for importer in args.importers
+            ],
+        }
+
+    output = args.output or DEFAULT_OUTPUT_DIR / time.strftime(
+        "import-%Y%m%d-%H%M%S.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    for result in report["results"]:
+        print(
+            "{importer}: {entries} entries in {elapsed_seconds:.1f}s "
+            "(load {load_seconds:.1f}s, {entries_per_second:.0f}/s), "
+            "peak RSS {rss:.0f} MB, "
+            "database {size:.1f} MB".format(
+                rss=result["peak_rss_bytes"] / 1024 / 1024,
+                size=result["db_size_bytes"] / 1024 / 1024,
+                **result,
+            )
+        )
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
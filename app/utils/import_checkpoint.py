@@ -0,0 +1,95 @@
+"""Byte-offset checkpoints for resumable dictionary imports.
+
+Importers call ``save_checkpoint`` inside the same transaction as each batch
+of rows, so after a crash the stored offset always matches the committed data.
+``--resume`` then seeks straight to that offset instead of starting over.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+
+class Checkpoint(NamedTuple):
+    source_path: str
+    source_size: int
+    byte_offset: int
+    entries: int
+    completed: bool
+
+
+def ensure_checkpoint_table(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS import_checkpoint (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            source_path TEXT NOT NULL,
+            source_size INTEGER NOT NULL,
+            byte_offset INTEGER NOT NULL,
+            entries INTEGER NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        )
+        """
+    )
+
+
+def save_checkpoint(
+    connection: sqlite3.Connection,
+    source_path: Path,
+    byte_offset: int,
+    entries: int,
+    completed: bool = False,
+) -> None:
+    """Record progress; the caller commits it together with the batch."""
+
+    connection.execute(
+        """
+        INSERT OR REPLACE INTO import_checkpoint (
+            id, source_path, source_size, byte_offset, entries, completed, updated_at
+        )
+        VALUES (1, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            str(source_path),
+            source_path.stat().st_size,
+            byte_offset,
+            entries,
+            int(completed),
+            time.time(),
+        ),
+    )
+
+
+def load_checkpoint(
+    connection: sqlite3.Connection,
+    source_path: Path,
+) -> Optional[Checkpoint]:
+    """Return the stored checkpoint, or ``None`` if there is nothing to resume.
+
+    Raises ``ValueError`` if the checkpoint was written for a different file,
+    since its byte offset would point into unrelated data.
+    """
+
+    try:
+        row = connection.execute(
+            """
+            SELECT source_path, source_size, byte_offset, entries, completed
+            FROM import_checkpoint WHERE id = 1
+            """
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if row is None:
+        return None
+
+    checkpoint = Checkpoint(row[0], row[1], row[2], row[3], bool(row[4]))
+    if checkpoint.source_size != source_path.stat().st_size:
+        raise ValueError(
+            f"Checkpoint was written for {checkpoint.source_path} "
+            f"({checkpoint.source_size} bytes), which does not match {source_path}"
+        )
+    return checkpoint
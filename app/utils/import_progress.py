@@ -0,0 +1,146 @@
+"""Progress reporting shared by the dictionary importers.
+
+Progress is measured by the byte offset reached in the input against its
+size, so no extra pass over the file is needed to count lines. Importers feed
+a ``ProgressTracker``; it emits ``ProgressEvent`` objects to a callback at most
+every ``interval`` seconds, which scripts and the UI can consume instead of
+parsing console output.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+@dataclass
+class ProgressEvent:
+    bytes_read: int
+    total_bytes: int
+    entries: int
+    rows: dict[str, int]
+    elapsed: float
+    start_offset: int = 0
+    done: bool = False
+    label: str = "Importing"
+    rows_per_second: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of the input consumed, or ``None`` if the size is unknown."""
+
+        if not self.total_bytes:
+            return None
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+    @property
+    def bytes_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.bytes_read - self.start_offset) / self.elapsed
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds remaining, from the byte rate of this run."""
+
+        if not self.total_bytes or self.bytes_per_second <= 0:
+            return None
+        return max(self.total_bytes - self.bytes_read, 0) / self.bytes_per_second
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class ProgressTracker:
+    """Accumulate importer counters and emit throttled ``ProgressEvent``s.
+
+    ``start_offset`` is where this run started reading, so resumed imports do
+    not count the skipped prefix in their rate. ``None`` takes it from the
+    first ``update``.
+    """
+
+    def __init__(
+        self,
+        total_bytes: int,
+        callback: Optional[ProgressCallback],
+        start_offset: Optional[int] = 0,
+        interval: float = 0.5,
+        label: str = "Importing",
+    ) -> None:
+        self.total_bytes = total_bytes
+        self.callback = callback
+        self.start_offset = start_offset
+        self.interval = interval
+        self.label = label
+        self.bytes_read = start_offset or 0
+        self.entries = 0
+        self.rows: dict[str, int] = {}
+        self.started = time.monotonic()
+        self.last_emit = 0.0
+
+    def add_rows(self, counts: dict[str, int]) -> None:
+        for table, count in counts.items():
+            self.rows[table] = self.rows.get(table, 0) + count
+
+    def update(self, bytes_read: int, entries: int) -> None:
+        if self.start_offset is None:
+            self.start_offset = bytes_read
+            self.started = time.monotonic()
+        self.bytes_read = bytes_read
+        self.entries = entries
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if now - self.last_emit >= self.interval:
+            self.last_emit = now
+            self.callback(self.event())
+
+    def finish(self) -> ProgressEvent:
+        event = self.event(done=True)
+        if self.callback is not None:
+            self.callback(event)
+        return event
+
+    def event(self, done: bool = False) -> ProgressEvent:
+        elapsed = time.monotonic() - self.started
+        return ProgressEvent(
+            bytes_read=self.bytes_read,
+            total_bytes=self.total_bytes,
+            entries=self.entries,
+            rows=dict(self.rows),
+            elapsed=elapsed,
+            start_offset=self.start_offset or 0,
+            done=done,
+            label=self.label,
+            rows_per_second={
+                table: count / elapsed if elapsed > 0 else 0.0
+                for table, count in self.rows.items()
+            },
+        )
+
+
+def print_progress(event: ProgressEvent) -> None:
+    """Console reporter: a single carriage-return line, newline when done."""
+
+    mb_read = event.bytes_read / 1024 / 1024
+    mb_rate = event.bytes_per_second / 1024 / 1024
+    parts = [f"{mb_read:.1f}MB"]
+    if event.fraction is not None:
+        parts[0] += (
+            f" / {event.total_bytes / 1024 / 1024:.1f}MB ({event.fraction * 100:.1f}%)"
+        )
+    if event.entries:
+        parts.append(f"{event.entries} entries")
+    parts.append(f"{mb_rate:.2f} MB/s")
+    if event.eta is not None and not event.done:
+        parts.append(f"ETA {event.eta:.0f}s")
+    rates = ", ".join(
+        f"{table} {rate:.0f}/s" for table, rate in event.rows_per_second.items()
+    )
+    if rates:
+        parts.append(rates)
+    end = "\n" if event.done else ""
+    sys.stdout.write(f"\r{event.label}: " + " | ".join(parts) + end)
+    sys.stdout.flush()
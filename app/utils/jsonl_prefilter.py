@@ -0,0 +1,84 @@
+"""Byte-level pre-filter for Kaikki JSONL dumps.
+
+Most lines in a dump are parts of speech (or languages) the importers throw
+away. Matching the raw bytes of a line against the ``"pos": "..."`` and
+``"lang_code": "..."`` markers is much cheaper than ``json.loads``, so only
+candidate lines are decoded. The filter is conservative: it may accept a line
+that the importer later rejects (e.g. a nested object with a matching ``pos``),
+but it must never reject a line the importer would keep.
+``verify_line_filter`` checks that property against a full decode.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from app.utils.compression import open_input
+
+LineFilter = Callable[[bytes], bool]
+
+
+def make_line_filter(
+    parts_of_speech: Iterable[str],
+    lang_code: Optional[str] = None,
+) -> LineFilter:
+    """Return a predicate accepting raw lines that may hold a matching entry."""
+
+    pos_alternatives = b"|".join(re.escape(pos.encode()) for pos in parts_of_speech)
+    pos_pattern = re.compile(rb'"pos"\s*:\s*"(?:' + pos_alternatives + rb')"')
+    if lang_code is None:
+        return lambda line: pos_pattern.search(line) is not None
+
+    lang_pattern = re.compile(
+        rb'"lang_code"\s*:\s*"' + re.escape(lang_code.encode()) + rb'"'
+    )
+    return lambda line: (
+        pos_pattern.search(line) is not None and lang_pattern.search(line) is not None
+    )
+
+
+def verify_line_filter(
+    path: Path,
+    line_filter: LineFilter,
+    accepts: Callable[[dict[str, Any]], bool],
+    sample_size: int,
+) -> dict[str, int]:
+    """Compare ``line_filter`` against a full decode of the first lines of ``path``.
+
+    ``accepts`` is the importer's own predicate on the decoded entry. Raises
+    ``ValueError`` if the filter rejects any line the importer would keep.
+    """
+
+    stats = {
+        "sampled": 0,
+        "candidates": 0,
+        "accepted": 0,
+        "false_positives": 0,
+        "false_negatives": 0,
+    }
+    with open_input(path) as stream:
+        for line in stream:
+            if stats["sampled"] >= sample_size:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            stats["sampled"] += 1
+            candidate = line_filter(line)
+            accepted = accepts(json.loads(line))
+            stats["candidates"] += candidate
+            stats["accepted"] += accepted
+            if candidate and not accepted:
+                stats["false_positives"] += 1
+            elif accepted and not candidate:
+                stats["false_negatives"] += 1
+
+    if stats["false_negatives"]:
+        raise ValueError(
+            f"Pre-filter rejected {stats['false_negatives']} of {stats['accepted']} "
+            f"matching lines in the first {stats['sampled']} lines of {path}"
+        )
+    return stats
@@ -0,0 +1,404 @@
+"""Single-pass import engine that feeds several sinks from one Kaikki dump.
+
+Each line is read and decoded once, then handed to every registered sink
+that accepts the entry: the app lookup schema (``words``/``translations``/
+...), the full lexical schema (``entries``/``senses``/``forms``/...), the
+app's full-text translation search on its own and a filtered JSONL export.
+Lines no sink could want are skipped by the union of the sinks' byte
+pre-filters. Run it as a module from the repository root::
+
+    python -m app.utils.lexicon_import fi.jsonl --app-db .web/finnish_dictionary.db \\
+        --lexical-db fi_words.sqlite --search-db .web/search.db --export fi-nouns-verbs.jsonl.gz
+
+The dedicated importers remain the way to resume an interrupted import or
+apply an ``--incremental`` update.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+from app.utils import convert_fi_jsonl_to_sqlite as lexical
+from app.utils import dictionary_downloader as downloader
+from app.utils.compression import open_input, open_output
+from app.utils.db_finalize import finalize_database
+from app.utils.import_progress import (
+    ProgressCallback,
+    ProgressEvent,
+    ProgressTracker,
+    print_progress,
+)
+from app.utils.jsonl_prefilter import LineFilter, make_line_filter
+
+DEFAULT_BATCH_SIZE = 10000
+
+
+class Sink(ABC):
+    """Receives the decoded entries of an import run.
+
+    ``line_filter`` is a conservative byte pre-filter for the lines the sink
+    may accept (``None`` means any line); ``accepts`` makes the decision on
+    the decoded entry. ``flush`` is called after every batch and ``close``
+    once at the end; both return the rows written per table since the last
+    call.
+    """
+
+    name = "sink"
+    line_filter: Optional[LineFilter] = None
+
+    def accepts(self, entry: dict[str, Any]) -> bool:
+        return True
+
+    @abstractmethod
+    def add(self, entry: dict[str, Any], line: bytes) -> None: ...
+
+    def flush(self) -> dict[str, int]:
+        return {}
+
+    def close(self) -> dict[str, int]:
+        return self.flush()
+
+
+class AppLookupSink(Sink):
+    """Fill the schema the app reads (``dictionary_downloader``'s database).
+
+    Like the downloader, it builds aside and swaps the result over
+    ``db_file`` on close, so the database can be rebuilt under a running app.
+    """
+
+    name = "app"
+
+    def __init__(
+        self,
+        db_file: Optional[Path] = None,
+        finalize: bool = False,
+        frequency_list: Optional[Path] = None,
+    ) -> None:
+        self.line_filter = downloader.LINE_FILTER
+        self.db_file = db_file
+        self.finalize = finalize
+        self.ranks = (
+            downloader._load_ranks(frequency_list) if frequency_list is not None else {}
+        )
+        self.build = downloader._build_path(db_file)
+        downloader._remove_db(self.build)
+        self.connection = downloader._open_import_db(self.build)
+        self.loader = downloader.BulkLoader(self.connection)
+
+    def accepts(self, entry: dict[str, Any]) -> bool:
+        return downloader._is_importable(entry)
+
+    def add(self, entry: dict[str, Any], line: bytes) -> None:
+        self.loader.add_entry(entry)
+
+    def flush(self) -> dict[str, int]:
+        counts = self.loader.flush()
+        self.connection.commit()
+        return counts
+
+    def close(self) -> dict[str, int]:
+        counts = self.flush()
+        downloader._finish_import(self.connection, self.ranks)
+        self.connection.close()
+        downloader._install_build(self.build, self.db_file, self.finalize)
+        return counts
+
+
+class LexicalSink(Sink):
+    """Fill the full lexical schema built by ``convert_fi_jsonl_to_sqlite``."""
+
+    name = "lexical"
+
+    def __init__(self, db_file: Path) -> None:
+        self.line_filter = lexical.LINE_FILTER
+        self.connection = sqlite3.connect(db_file)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        lexical.init_database(self.connection)
+        self.cursor = self.connection.cursor()
+        self.tags = lexical.TagDictionary(self.connection)
+        self.strings = lexical.StringPool(self.connection)
+        self.counts: dict[str, int] = {}
+
+    def accepts(self, entry: dict[str, Any]) -> bool:
+        return lexical.is_target_entry(entry)
+
+    def add(self, entry: dict[str, Any], line: bytes) -> None:
+        entry_rows = lexical.build_entry_rows(entry, lexical.content_hash(line))
+        if entry_rows is None:
+            return
+        lexical.insert_entry(self.cursor, entry_rows, self.tags, self.strings)
+        for table, count in lexical.count_rows(entry_rows).items():
+            self.counts[table] = self.counts.get(table, 0) + count
+
+    def flush(self) -> dict[str, int]:
+        self.connection.commit()
+        counts, self.counts = self.counts, {}
+        return counts
+
+    def close(self) -> dict[str, int]:
+        counts = self.flush()
+        self.connection.close()
+        return counts
+
+
+class SearchIndexSink(Sink):
+    """Build the app's English -> Finnish search index in a database of its own.
+
+    It holds ``words``, ``translations`` and the ``translation_search``
+    full-text index in the app schema, built by ``dictionary_downloader``'s
+    ``build_translation_search``, so ``db_helper.search_by_translation`` can
+    query it. The database is replaced if it exists.
+    """
+
+    name = "search"
+
+    def __init__(self, db_file: Path) -> None:
+        self.line_filter = downloader.LINE_FILTER
+        downloader._remove_db(Path(db_file))
+        downloader.init_db(create_indexes=False, db_file=db_file)
+        self.connection = sqlite3.connect(db_file)
+        self.word_ids: dict[str, int] = {}
+        self.words: list[tuple[int, str, str]] = []
+        self.translations: list[tuple[int, str, str, str]] = []
+
+    def accepts(self, entry: dict[str, Any]) -> bool:
+        return downloader._is_importable(entry)
+
+    def add(self, entry: dict[str, Any], line: bytes) -> None:
+        word = entry["word"]
+        word_id = self.word_ids.get(word)
+        if word_id is None:
+            word_id = self.word_ids[word] = len(self.word_ids) + 1
+            self.words.append((word_id, word, entry["pos"]))
+        for sense in entry.get("senses") or []:
+            for gloss in sense.get("glosses") or []:
+                self.translations.append((word_id, "en", gloss, gloss))
+
+    def flush(self) -> dict[str, int]:
+        self.connection.executemany(
+            "INSERT INTO words (id, word, pos) VALUES (?, ?, ?)", self.words
+        )
+        self.connection.executemany(
+            "INSERT INTO translations (word_id, language_code, translation, definition) VALUES (?, ?, ?, ?)",
+            self.translations,
+        )
+        self.connection.commit()
+        counts = {"words": len(self.words), "translations": len(self.translations)}
+        self.words.clear()
+        self.translations.clear()
+        return counts
+
+    def close(self) -> dict[str, int]:
+        counts = self.flush()
+        downloader._create_indexes(self.connection.cursor())
+        downloader.build_translation_search(self.connection)
+        self.connection.close()
+        return counts
+
+
+class JsonlExportSink(Sink):
+    """Copy the raw lines of matching entries to a (compressed) JSONL file."""
+
+    name = "export"
+
+    def __init__(
+        self,
+        path: Path,
+        parts_of_speech: Optional[Iterable[str]] = lexical.TARGET_PARTS_OF_SPEECH,
+        lang_code: Optional[str] = None,
+    ) -> None:
+        self.parts_of_speech = set(parts_of_speech) if parts_of_speech else None
+        self.lang_code = lang_code
+        if self.parts_of_speech:
+            self.line_filter = make_line_filter(self.parts_of_speech, lang_code)
+        self.stream = open_output(path)
+        self.written = 0
+
+    def accepts(self, entry: dict[str, Any]) -> bool:
+        if self.parts_of_speech and entry.get("pos") not in self.parts_of_speech:
+            return False
+        return self.lang_code is None or entry.get("lang_code") == self.lang_code
+
+    def add(self, entry: dict[str, Any], line: bytes) -> None:
+        self.stream.write(line + b"\n")
+        self.written += 1
+
+    def flush(self) -> dict[str, int]:
+        counts = {"lines": self.written}
+        self.written = 0
+        return counts
+
+    def close(self) -> dict[str, int]:
+        counts = self.flush()
+        self.stream.close()
+        return counts
+
+
+def union_line_filter(sinks: Sequence[Sink]) -> Optional[LineFilter]:
+    """Accept a line if any sink's pre-filter does; ``None`` if one reads all."""
+
+    filters = [sink.line_filter for sink in sinks]
+    if any(line_filter is None for line_filter in filters):
+        return None
+    return lambda line: any(line_filter(line) for line_filter in filters)
+
+
+def run_import(
+    source: Path,
+    sinks: Sequence[Sink],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    prefilter: bool = True,
+    progress: Optional[ProgressCallback] = print_progress,
+) -> ProgressEvent:
+    """Stream ``source`` once, fanning each decoded entry out to ``sinks``.
+
+    Sinks are flushed every ``batch_size`` lines and closed at the end. Row
+    counts in the returned event are keyed ``<sink>.<table>``.
+    """
+
+    line_filter = union_line_filter(sinks) if prefilter else None
+    tracker = ProgressTracker(source.stat().st_size, progress)
+
+    def collect(sink: Sink, counts: dict[str, int]) -> None:
+        tracker.add_rows(
+            {f"{sink.name}.{table}": count for table, count in counts.items()}
+        )
+
+    lines_read = 0
+    with open_input(source) as stream:
+        for line in stream:
+            lines_read += 1
+            line = line.strip()
+            if line and (line_filter is None or line_filter(line)):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logging.exception(f"Failed to decode JSON line {lines_read}")
+                    entry = None
+                if entry is not None:
+                    for sink in sinks:
+                        if sink.accepts(entry):
+                            sink.add(entry, line)
+            if lines_read % batch_size == 0:
+                for sink in sinks:
+                    collect(sink, sink.flush())
+            tracker.update(stream.raw_position, lines_read)
+    for sink in sinks:
+        collect(sink, sink.close())
+    return tracker.finish()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "input_path",
+        type=Path,
+        help="Kaikki JSONL dump (optionally gzip, xz or zstd compressed).",
+    )
+    parser.add_argument(
+        "--app-db",
+        type=Path,
+        default=None,
+        help="Fill the app lookup schema (words, translations, ...) in this database.",
+    )
+    parser.add_argument(
+        "--lexical-db",
+        type=Path,
+        default=None,
+        help="Build the full lexical schema (entries, senses, forms, ...) in this database.",
+    )
+    parser.add_argument(
+        "--search-db",
+        type=Path,
+        default=None,
+        help="Build the app's English -> Finnish search index alone in this database.",
+    )
+    parser.add_argument(
+        "--export",
+        type=Path,
+        default=None,
+        help="Write the raw noun/verb lines to this JSONL file (compressed by suffix).",
+    )
+    parser.add_argument(
+        "--frequency-list",
+        type=Path,
+        default=None,
+        help="Word-frequency list to rank the app database's words by: one word per line, most frequent first, optionally followed by a count.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of input lines between commits.",
+    )
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Decode every line instead of skipping lines no sink wants by their raw bytes.",
+    )
+    parser.add_argument(
+        "--finalize",
+        action="store_true",
+        help="Analyze and compact every database written into a read-only artifact.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print progress while importing.",
+    )
+    args = parser.parse_args()
+    if not (args.app_db or args.lexical_db or args.search_db or args.export):
+        parser.error(
+            "choose at least one of --app-db, --lexical-db, --search-db, --export"
+        )
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {args.input_path}")
+
+    sinks: list[Sink] = []
+    if args.app_db:
+        sinks.append(
+            AppLookupSink(
+                args.app_db,
+                finalize=args.finalize,
+                frequency_list=args.frequency_list,
+            )
+        )
+    if args.lexical_db:
+        sinks.append(LexicalSink(args.lexical_db))
+    if args.search_db:
+        sinks.append(SearchIndexSink(args.search_db))
+    if args.export:
+        sinks.append(JsonlExportSink(args.export))
+
+    event = run_import(
+        args.input_path,
+        sinks,
+        batch_size=args.batch_size,
+        prefilter=not args.no_prefilter,
+        progress=None if args.quiet else print_progress,
+    )
+    rows = ", ".join(f"{table} {count}" for table, count in event.rows.items())
+    print(f"Completed. Read {event.entries} lines in {event.elapsed:.1f}s: {rows}.")
+    if args.finalize:
+        # The app database was already finalized as part of its swap.
+        for path in (args.lexical_db, args.search_db):
+            if path is not None:
+                finalize_database(path)
+                print(f"Finalized {path} as a read-only artifact.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Load-test word lookups from many concurrent async sessions.
+
+Each simulated session awaits lookups of random dictionary words with a
+short pause in between, the way ``TranslationState.lookup_word_from_db``
+serves a user. A heartbeat task measures how late the event loop wakes it
+up: lookups that ran on the loop show up as lag. ``--blocking`` calls the
+synchronous ``get_word_details`` on the loop for comparison. Run it as a
+module from the repository root::
+
+    python -m app.utils.lookup_load_bench --sessions 100 --cache-size 0
+    python -m app.utils.lookup_load_bench --sessions 100 --cache-size 0 --blocking
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+from app.utils import db_helper
+
+HEARTBEAT_INTERVAL = 0.005
+
+
+def sample_words(db_file: Path, count: int, seed: int) -> list[str]:
+    conn = sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        words = [row[0] for row in conn.execute("SELECT word FROM words")]
+    finally:
+        conn.close()
+    rng = random.Random(seed)
+    return rng.sample(words, min(count, len(words)))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def session(
+    words: list[str],
+    lookups: int,
+    seed: int,
+    think_time: float,
+    blocking: bool,
+    latencies: list[float],
+) -> None:
+    rng = random.Random(seed)
+    for _ in range(lookups):
+        await asyncio.sleep(rng.uniform(0, 2 * think_time))
+        word = rng.choice(words)
+        started = time.perf_counter()
+        if blocking:
+            db_helper.get_word_details(word)
+        else:
+            await db_helper.get_word_details_async(word)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_load_test(
+    words: list[str],
+    sessions: int,
+    lookups: int,
+    seed: int,
+    think_time: float,
+    blocking: bool,
+) -> dict[str, float]:
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            session(words, lookups, seed + number, think_time, blocking, latencies)
+            for number in range(sessions)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await beat
+    return {
+        "lookups": len(latencies),
+        "elapsed_seconds": elapsed,
+        "lookups_per_second": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1000,
+        "latency_p95_ms": percentile(latencies, 0.95) * 1000,
+        "latency_max_ms": max(latencies, default=0.0) * 1000,
+        "loop_lag_mean_ms": statistics.fmean(lags) * 1000 if lags else 0.0,
+        "loop_lag_p99_ms": percentile(lags, 0.99) * 1000,
+        "loop_lag_max_ms": max(lags, default=0.0) * 1000,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", type=Path, default=db_helper.DB_FILE)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--lookups", type=int, default=100, help="Lookups per session.")
+    parser.add_argument(
+        "--words", type=int, default=5000, help="Distinct words to draw from."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.02,
+        help="Mean pause in seconds between a session's lookups.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=db_helper.LOOKUP_CACHE_SIZE,
+        help="Lookup cache size; 0 sends every lookup to SQLite.",
+    )
+    parser.add_argument(
+        "--blocking",
+        action="store_true",
+        help="Call the synchronous lookup on the event loop instead.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.db.exists():
+        raise FileNotFoundError(f"Dictionary database not found: {args.db}")
+    db_helper.DB_FILE = args.db
+    db_helper._cache.maxsize = args.cache_size
+    words = sample_words(args.db, args.words, args.seed)
+    report = asyncio.run(
+        run_load_test(
+            words,
+            args.sessions,
+            args.lookups,
+            args.seed,
+            args.think_time,
+            args.blocking,
+        )
+    )
+    mode = "blocking" if args.blocking else "async"
+    print(
+        f"{mode}: {report['lookups']} lookups from {args.sessions} sessions in "
+        f"{report['elapsed_seconds']:.2f}s ({report['lookups_per_second']:.0f}/s)"
+    )
+    print(
+        "latency p50 {latency_p50_ms:.2f} ms, p95 {latency_p95_ms:.2f} ms, "
+        "max {latency_max_ms:.2f} ms".format(**report)
+    )
+    print(
+        "event loop lag mean {loop_lag_mean_ms:.2f} ms, p99 {loop_lag_p99_ms:.2f} ms, "
+        "max {loop_lag_max_ms:.2f} ms".format(**report)
+    )
+    if not args.blocking:
+        timings = db_helper.lookup_timing_stats()
+        print(
+            "executor: {count} lookups, queue wait mean {queue_wait_mean_ms:.2f} ms "
+            "(max {queue_wait_max_ms:.2f}), execution mean {execution_mean_ms:.2f} ms "
+            "(max {execution_max_ms:.2f})".format(**timings)
+        )
+    print(
+        "cache: {hits} hits, {misses} misses".format(**db_helper.lookup_cache_stats())
+    )
+    db_helper.close_connections()
+
+
+if __name__ == "__main__":
+    main()
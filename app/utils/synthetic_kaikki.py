@@ -0,0 +1,306 @@
+"""Generate synthetic Kaikki-shaped JSONL dumps for benchmarking the importers.
+
+Entries follow the structure of the Finnish Wiktionary export closely enough
+to exercise every code path of both importers (senses with glosses, examples,
+synonyms and categories; inflection tables; derived and related terms), but
+the words themselves are made up. Output is deterministic for a given seed.
+Run it as a module from the repository root::
+
+    python -m app.utils.synthetic_kaikki .web/synthetic.jsonl --entries 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple, Optional
+
+from app.utils.compression import open_output
+
+# Roughly the part-of-speech mix of the real Finnish dump.
+DEFAULT_POS_MIX = {
+    "noun": 0.40,
+    "verb": 0.15,
+    "adj": 0.15,
+    "name": 0.10,
+    "adv": 0.08,
+    "num": 0.04,
+    "intj": 0.04,
+    "phrase": 0.04,
+}
+CASES = [
+    "nominative",
+    "genitive",
+    "partitive",
+    "inessive",
+    "elative",
+    "illative",
+    "adessive",
+    "ablative",
+    "allative",
+    "essive",
+    "translative",
+    "instructive",
+    "abessive",
+    "comitative",
+]
+PERSONS = [
+    ("first-person", "singular"),
+    ("second-person", "singular"),
+    ("third-person", "singular"),
+    ("first-person", "plural"),
+    ("second-person", "plural"),
+    ("third-person", "plural"),
+]
+MOODS = [
+    ("present", "indicative"),
+    ("past", "indicative"),
+    ("present", "conditional"),
+    ("present", "imperative"),
+    ("present", "potential"),
+]
+NOUN_TAG_SETS = [[case, number] for case in CASES for number in ("singular", "plural")]
+VERB_TAG_SETS = [[*mood, *person] for mood in MOODS for person in PERSONS] + [
+    [*mood, "negative"] for mood in MOODS
+]
+SYLLABLES = ["ka", "lo", "mi", "su", "te", "va", "hä", "ny", "rö", "pi", "ju", "ko"]
+GLOSS_WORDS = ["house", "water", "speak", "run", "light", "stone", "tree", "bird"]
+SENSE_TAGS = ["transitive", "intransitive", "colloquial", "rare", "dialectal"]
+TOPICS = ["biology", "law", "music", "sports", "cooking"]
+# Languages of the non-Finnish entries mixed in by ``foreign_rate``.
+FOREIGN_LANGUAGES = [("Swedish", "sv"), ("Estonian", "et"), ("English", "en")]
+
+
+class FanOut(NamedTuple):
+    """Upper bounds for the nested collections of each generated entry."""
+
+    senses: int = 3
+    forms: int = 28
+    derived: int = 4
+    related: int = 3
+
+
+DEFAULT_FAN_OUT = FanOut()
+
+
+def make_word(rng: random.Random, index: int) -> str:
+    # The index suffix keeps words unique; homographs come from repeats below.
+    stem = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return f"{stem}{index}"
+
+
+def make_terms(rng: random.Random, count: int) -> list[dict[str, Any]]:
+    terms = []
+    for _ in range(count):
+        term: dict[str, Any] = {"word": make_word(rng, rng.randrange(10**6))}
+        if rng.random() < 0.3:
+            term["tags"] = [rng.choice(SENSE_TAGS)]
+        terms.append(term)
+    return terms
+
+
+def make_sense(rng: random.Random, word: str, number: int) -> dict[str, Any]:
+    glosses = [
+        " ".join(rng.sample(GLOSS_WORDS, rng.randint(1, 3)))
+        for _ in range(rng.randint(1, 2))
+    ]
+    sense: dict[str, Any] = {
+        "id": f"en-{word}-fi-{number}",
+        "glosses": glosses,
+        "raw_glosses": [f"({rng.choice(TOPICS)}) {glosses[0]}"],
+        "categories": [
+            {"name": "Finnish lemmas", "kind": "other", "source": "w"},
+        ],
+    }
+    if rng.random() < 0.5:
+        sense["tags"] = rng.sample(SENSE_TAGS, rng.randint(1, 2))
+    if rng.random() < 0.3:
+        sense["topics"] = [rng.choice(TOPICS)]
+    if rng.random() < 0.4:
+        sense["examples"] = [
+            {"text": f"{word.capitalize()} on tässä.", "english": glosses[0]}
+        ]
+    if rng.random() < 0.3:
+        sense["synonyms"] = make_terms(rng, rng.randint(1, 3))
+    if rng.random() < 0.1:
+        sense["antonyms"] = make_terms(rng, 1)
+    if rng.random() < 0.1:
+        sense["links"] = [[glosses[0], glosses[0]]]
+    return sense
+
+
+def make_forms(
+    rng: random.Random, word: str, pos: str, limit: int
+) -> list[dict[str, Any]]:
+    if pos == "noun":
+        tag_sets = NOUN_TAG_SETS
+    elif pos == "verb":
+        tag_sets = VERB_TAG_SETS
+    else:
+        tag_sets = [["comparative"], ["superlative"], ["plural"]]
+    count = rng.randint(min(limit, len(tag_sets)) // 2, limit) if limit else 0
+    forms = []
+    for number, tags in enumerate(itertools.islice(itertools.cycle(tag_sets), count)):
+        suffix = "".join(tag[:2] for tag in tags)
+        forms.append(
+            {
+                "form": f"{word}{suffix}{number // len(tag_sets) or ''}",
+                "tags": list(tags),
+            }
+        )
+    return forms
+
+
+def generate_entries(
+    count: int,
+    seed: int = 0,
+    pos_mix: Optional[dict[str, float]] = None,
+    fan_out: FanOut = DEFAULT_FAN_OUT,
+    homograph_rate: float = 0.05,
+    foreign_rate: float = 0.1,
+) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` Kaikki-style entries.
+
+    ``pos_mix`` weights the parts of speech; ``homograph_rate`` is the share
+    of entries that reuse an earlier word with a new etymology number;
+    ``foreign_rate`` is the share of entries in another language, which
+    importers limited to Finnish have to skip.
+    """
+
+    rng = random.Random(seed)
+    mix = pos_mix or DEFAULT_POS_MIX
+    parts_of_speech = list(mix)
+    weights = list(mix.values())
+    recent: list[str] = []
+    for index in range(count):
+        pos = rng.choices(parts_of_speech, weights)[0]
+        lang, lang_code = "Finnish", "fi"
+        if foreign_rate and rng.random() < foreign_rate:
+            lang, lang_code = rng.choice(FOREIGN_LANGUAGES)
+        if recent and rng.random() < homograph_rate:
+            word = rng.choice(recent)
+            etymology_number = rng.randint(2, 3)
+        else:
+            word = make_word(rng, index)
+            etymology_number = 1
+            recent = (recent + [word])[-100:]
+        entry: dict[str, Any] = {
+            "word": word,
+            "lang": lang,
+            "lang_code": lang_code,
+            "pos": pos,
+            "etymology_number": etymology_number,
+            "etymology_text": f"From Proto-Finnic *{word[:4]}.",
+            "senses": [
+                make_sense(rng, word, number)
+                for number in range(1, rng.randint(1, max(fan_out.senses, 1)) + 1)
+            ],
+        }
+        forms = make_forms(rng, word, pos, fan_out.forms)
+        if forms:
+            entry["forms"] = forms
+        if pos == "verb":
+            entry["inflection_templates"] = [
+                {"name": "fi-conj-sanoa", "args": {"1": word[:-1], "2": word[-1]}}
+            ]
+        elif pos == "noun":
+            entry["inflection_templates"] = [
+                {"name": "fi-decl-valo", "args": {"1": word}}
+            ]
+        derived = make_terms(rng, rng.randint(0, fan_out.derived))
+        if derived:
+            entry["derived"] = derived
+        related = make_terms(rng, rng.randint(0, fan_out.related))
+        if related:
+            entry["related"] = related
+        yield entry
+
+
+def write_jsonl(path: Path, entries: Iterator[dict[str, Any]]) -> int:
+    """Write ``entries`` to ``path``, compressed if it ends in .gz/.xz/.zst."""
+
+    written = 0
+    with open_output(path) as stream:
+        for entry in entries:
+            stream.write(json.dumps(entry, ensure_ascii=False).encode() + b"\n")
+            written += 1
+    return written
+
+
+def parse_pos_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for item in value.split(","):
+        pos, _, weight = item.partition("=")
+        mix[pos.strip()] = float(weight)
+    return mix
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output_path", type=Path, help="Where to write the JSONL.")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--pos-mix",
+        type=parse_pos_mix,
+        default=None,
+        help="Comma-separated pos=weight pairs, e.g. noun=0.5,verb=0.3,adj=0.2.",
+    )
+    parser.add_argument(
+        "--senses",
+        type=int,
+        default=DEFAULT_FAN_OUT.senses,
+        help="Maximum senses per entry.",
+    )
+    parser.add_argument(
+        "--forms",
+        type=int,
+        default=DEFAULT_FAN_OUT.forms,
+        help="Maximum inflected forms per entry.",
+    )
+    parser.add_argument(
+        "--derived",
+        type=int,
+        default=DEFAULT_FAN_OUT.derived,
+        help="Maximum derived terms per entry.",
+    )
+    parser.add_argument(
+        "--related",
+        type=int,
+        default=DEFAULT_FAN_OUT.related,
+        help="Maximum related terms per entry.",
+    )
+    parser.add_argument(
+        "--homograph-rate",
+        type=float,
+        default=0.05,
+        help="Share of entries reusing an earlier word with another etymology.",
+    )
+    parser.add_argument(
+        "--foreign-rate",
+        type=float,
+        default=0.1,
+        help="Share of entries in a language other than Finnish.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    entries = generate_entries(
+        args.entries,
+        seed=args.seed,
+        pos_mix=args.pos_mix,
+        fan_out=FanOut(args.senses, args.forms, args.derived, args.related),
+        homograph_rate=args.homograph_rate,
+        foreign_rate=args.foreign_rate,
+    )
+    written = write_jsonl(args.output_path, entries)
+    print(f"Wrote {written} synthetic entries to {args.output_path}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from app.utils import db_helper
+from app.utils import dictionary_downloader as downloader
+from app.utils.synthetic_kaikki import generate_entries, write_jsonl
+
+SYNTHETIC_ENTRIES = 400
+
+
+@pytest.fixture(scope="session")
+def synthetic_dump(tmp_path_factory):
+    """A small synthetic Kaikki dump shared by the import tests."""
+    path = tmp_path_factory.mktemp("dump") / "kaikki.jsonl"
+    write_jsonl(path, generate_entries(SYNTHETIC_ENTRIES, seed=1))
+    return path
+
+
+@pytest.fixture(scope="session")
+def imported_entries(synthetic_dump):
+    """The entries of ``synthetic_dump`` the app database keeps."""
+    with open(synthetic_dump, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    return [entry for entry in entries if downloader._is_importable(entry)]
+
+
+@pytest.fixture(scope="session")
+def dictionary_db(synthetic_dump, tmp_path_factory):
+    """The app database imported from ``synthetic_dump``; do not modify it."""
+    db_file = tmp_path_factory.mktemp("dictionary") / "finnish_dictionary.db"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(downloader, "DB_FILE", db_file)
+        downloader.import_to_sqlite(progress=None, source=synthetic_dump)
+    return db_file
+
+
+@pytest.fixture
+def lookups(dictionary_db, monkeypatch):
+    """``db_helper`` reading ``dictionary_db``, starting with an empty cache."""
+    monkeypatch.setattr(db_helper, "DB_FILE", dictionary_db)
+    db_helper.clear_lookup_cache()
+    return db_helper
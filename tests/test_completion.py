@@ -0,0 +1,102 @@
+import asyncio
+import os
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.utils import db_helper
+
+
+@pytest.fixture
+def completion(lookups, monkeypatch):
+    """``db_helper`` with no typeahead index loaded or being built."""
+    monkeypatch.setattr(db_helper, "_completion", None)
+    monkeypatch.setattr(db_helper, "_completion_started", None)
+    return lookups
+
+
+def wait_for_index(lookups, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while lookups.completion_stats() is None:
+        assert time.monotonic() < deadline, "the typeahead index was not built"
+        time.sleep(0.01)
+
+
+def texts(completions):
+    return [completion["text"] for completion in completions]
+
+
+def test_typeahead_is_empty_until_the_index_is_built(completion, imported_entries):
+    prefix = imported_entries[0]["word"][:2]
+    assert completion.complete_word(prefix) == []
+    wait_for_index(completion)
+    assert completion.complete_word(prefix)
+
+
+def test_completions_start_with_the_prefix(completion, imported_entries):
+    completion.load_completion_index()
+    wait_for_index(completion)
+    for entry in imported_entries[:20]:
+        word = entry["word"]
+        results = completion.complete_word(word[:2], limit=20)
+        assert 0 < len(results) <= 20
+        assert all(text.startswith(word[:2]) for text in texts(results))
+        # Nothing sorts ahead of the shortest lemma with a given prefix.
+        assert texts(completion.complete_word(word))[0] == word
+        assert completion.complete_word(word.upper()) == completion.complete_word(word)
+
+
+def test_build_uses_neither_the_pool_nor_the_executor(
+    completion, imported_entries, monkeypatch
+):
+    def unavailable(*args, **kwargs):
+        raise AssertionError("the typeahead must not use the lookup pool or executor")
+
+    monkeypatch.setattr(completion._pool, "connection", unavailable)
+    monkeypatch.setattr(completion, "_run_lookup", unavailable)
+    word = imported_entries[0]["word"]
+    assert asyncio.run(completion.complete_word_async(word)) == []
+    wait_for_index(completion)
+    assert texts(asyncio.run(completion.complete_word_async(word)))[0] == word
+
+
+def test_swapped_database_gets_a_new_index(
+    completion, dictionary_db, tmp_path, monkeypatch
+):
+    db_file = tmp_path / "finnish_dictionary.db"
+    shutil.copy(dictionary_db, db_file)
+    monkeypatch.setattr(completion, "DB_FILE", db_file)
+    completion.load_completion_index()
+    wait_for_index(completion)
+    assert completion.complete_word("zzz") == []
+
+    update = tmp_path / "update.db"
+    shutil.copy(dictionary_db, update)
+    connection = sqlite3.connect(update)
+    connection.execute("INSERT INTO words (word, pos) VALUES ('zzzuusi', 'noun')")
+    connection.commit()
+    connection.close()
+    os.replace(update, db_file)
+
+    assert completion.complete_word("zzz") == []
+    wait_for_index(completion)
+    assert texts(completion.complete_word("zzz")) == ["zzzuusi"]
+
+
+def test_lifespan_builds_the_index_at_startup(completion, monkeypatch):
+    # The lifespan closes the pool and executor on exit; give it its own.
+    monkeypatch.setattr(completion, "_pool", completion.ConnectionPool())
+    monkeypatch.setattr(completion, "_executor", ThreadPoolExecutor(max_workers=1))
+
+    async def serve():
+        async with completion.lookup_lifespan():
+            for _ in range(1000):
+                if completion.completion_stats() is not None:
+                    return completion.completion_stats()
+                await asyncio.sleep(0.01)
+
+    stats = asyncio.run(serve())
+    assert stats is not None and stats["entries"] > 0
@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from app.utils import dictionary_downloader as downloader
+from app.utils.db_finalize import FINAL_PAGE_SIZE, finalize_database, is_finalized
+
+
+@pytest.fixture
+def imported(synthetic_dump, tmp_path, monkeypatch):
+    """A database imported from the synthetic dump, still in WAL mode."""
+    monkeypatch.setattr(downloader, "DB_FILE", tmp_path / "dictionary.db")
+    downloader.import_to_sqlite(progress=None, source=synthetic_dump)
+    return tmp_path / "dictionary.db"
+
+
+def pragma(path, name):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(f"PRAGMA {name}").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def word_count(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_finalize_writes_a_compact_marked_copy(imported, tmp_path):
+    output = finalize_database(imported, tmp_path / "final.db")
+    assert is_finalized(output)
+    assert not is_finalized(imported)
+    assert pragma(output, "page_size") == FINAL_PAGE_SIZE
+    assert pragma(output, "journal_mode") == "delete"
+    assert word_count(output) == word_count(imported)
+    connection = sqlite3.connect(output)
+    assert connection.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0]
+    connection.close()
+
+
+def test_finalize_in_place_removes_the_wal(imported):
+    for suffix in ("-wal", "-shm"):
+        imported.with_name(imported.name + suffix).write_bytes(b"")
+    finalize_database(imported)
+    assert is_finalized(imported)
+    assert not imported.with_name(imported.name + "-wal").exists()
+
+
+def test_import_can_finalize_before_the_swap(synthetic_dump, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader, "DB_FILE", tmp_path / "dictionary.db")
+    downloader.import_to_sqlite(progress=None, source=synthetic_dump, finalize=True)
+    assert is_finalized(tmp_path / "dictionary.db")
+
+
+def test_rollback_journal_database_without_marker_is_not_finalized(tmp_path):
+    path = tmp_path / "plain.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE words (word TEXT)")
+    connection.commit()
+    connection.close()
+    assert pragma(path, "journal_mode") == "delete"
+    assert not is_finalized(path)
+
+
+def test_finalized_database_written_in_wal_mode_is_not_finalized(imported):
+    finalize_database(imported)
+    connection = sqlite3.connect(imported)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("CREATE TABLE notes (note TEXT)")
+    connection.commit()
+    assert not is_finalized(imported)
+    connection.close()
+    assert not is_finalized(imported)
+
+
+def test_missing_or_foreign_files_are_not_finalized(tmp_path):
+    assert not is_finalized(tmp_path / "missing.db")
+    (tmp_path / "notes.txt").write_text("not a database")
+    assert not is_finalized(tmp_path / "notes.txt")
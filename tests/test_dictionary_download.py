@@ -0,0 +1,198 @@
+import hashlib
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.utils import dictionary_downloader as downloader
+from app.utils.dictionary_downloader import DownloadStatus
+
+
+class DumpHandler(BaseHTTPRequestHandler):
+    """Serves ``server.body`` with an ETag and, optionally, byte ranges."""
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def respond(self, send_body):
+        server = self.server
+        server.requests.append((self.command, dict(self.headers)))
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        size = len(server.body)
+        start, end, status = 0, size - 1, 200
+        requested = self.headers.get("Range")
+        if requested and server.ranges:
+            first, _, last = requested.removeprefix("bytes=").partition("-")
+            start, end, status = int(first), int(last or size - 1), 206
+            if start >= size:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("ETag", server.etag)
+        if server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if send_body:
+            body = server.body[start : end + 1]
+            if server.truncate_at is not None:
+                # Drop the connection partway, like a network failure.
+                body = body[: server.truncate_at]
+                self.close_connection = True
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(synthetic_dump, monkeypatch):
+    # Resumes continue from the last whole chunk written; keep chunks small
+    # so the dump spans many of them.
+    monkeypatch.setattr(downloader, "DOWNLOAD_CHUNK_SIZE", 256)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DumpHandler)
+    server.body = synthetic_dump.read_bytes()
+    server.etag = '"v1"'
+    server.ranges = True
+    server.truncate_at = None
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/kaikki.jsonl"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def download(server, dest, **options):
+    return downloader.download_dictionary(
+        url=server.url, dest=dest, retries=0, progress=None, **options
+    )
+
+
+def range_headers(server):
+    return [
+        headers.get("Range") for method, headers in server.requests if method == "GET"
+    ]
+
+
+def test_download_resumes_a_truncated_part(server, tmp_path):
+    dest = tmp_path / "kaikki.jsonl"
+    server.truncate_at = 1024
+    assert download(server, dest) is DownloadStatus.FAILED
+    assert (tmp_path / "kaikki.jsonl.part").stat().st_size == 1024
+
+    server.truncate_at = None
+    assert download(server, dest) is DownloadStatus.DOWNLOADED
+    assert dest.read_bytes() == server.body
+    assert range_headers(server) == [None, "bytes=1024-"]
+
+
+def test_unchanged_dump_is_not_downloaded_again(server, tmp_path):
+    dest = tmp_path / "kaikki.jsonl"
+    assert download(server, dest) is DownloadStatus.DOWNLOADED
+    server.requests.clear()
+
+    assert download(server, dest) is DownloadStatus.NOT_MODIFIED
+    [(method, headers)] = server.requests
+    assert method == "HEAD"
+    assert headers["If-None-Match"] == server.etag
+    assert dest.read_bytes() == server.body
+
+
+def test_server_ignoring_ranges_restarts_the_part(server, tmp_path):
+    dest = tmp_path / "kaikki.jsonl"
+    server.ranges = False
+    server.truncate_at = 1024
+    assert download(server, dest) is DownloadStatus.FAILED
+
+    server.truncate_at = None
+    assert download(server, dest) is DownloadStatus.DOWNLOADED
+    # The resume asked for a range, got a 200 and rewrote the part from zero.
+    assert range_headers(server) == [None, "bytes=1024-"]
+    assert dest.read_bytes() == server.body
+
+
+def word_count(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_download_and_import_streams_the_dump(
+    server, synthetic_dump, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(downloader, "DB_FILE", tmp_path / "imported.db")
+    downloader.import_to_sqlite(progress=None, source=synthetic_dump)
+
+    monkeypatch.setattr(downloader, "DB_FILE", tmp_path / "streamed.db")
+    tee = tmp_path / "tee.jsonl.gz"
+    status = downloader.download_and_import(url=server.url, tee_path=tee, progress=None)
+    assert status is DownloadStatus.DOWNLOADED
+    assert word_count(tmp_path / "streamed.db") == word_count(tmp_path / "imported.db")
+    with downloader.open_input(tee) as f:
+        assert f.read() == server.body
+
+    assert (
+        downloader.download_and_import(url=server.url, progress=None)
+        is DownloadStatus.NOT_MODIFIED
+    )
+
+
+def leftover_parts(dest):
+    return sorted(path.name for path in dest.parent.glob(f"{dest.name}.part*"))
+
+
+def test_segmented_download_resumes_each_segment(server, tmp_path):
+    dest = tmp_path / "kaikki.jsonl"
+    server.truncate_at = 1024
+    assert download(server, dest, segments=4) is DownloadStatus.FAILED
+    size = len(server.body)
+    starts = [number * size // 4 for number in range(4)]
+
+    server.truncate_at = None
+    server.requests.clear()
+    assert download(server, dest, segments=4) is DownloadStatus.DOWNLOADED
+    assert dest.read_bytes() == server.body
+    assert sorted(range_headers(server)) == sorted(
+        f"bytes={start + 1024}-{end - 1}"
+        for start, end in zip(starts, [*starts[1:], size])
+    )
+    assert leftover_parts(dest) == []
+
+
+def test_changed_segment_count_starts_over(server, tmp_path):
+    dest = tmp_path / "kaikki.jsonl"
+    server.truncate_at = 1024
+    assert download(server, dest, segments=4) is DownloadStatus.FAILED
+    assert "kaikki.jsonl.part3" in leftover_parts(dest)
+
+    server.truncate_at = None
+    assert download(server, dest, segments=2) is DownloadStatus.DOWNLOADED
+    assert dest.read_bytes() == server.body
+    assert leftover_parts(dest) == []
+
+
+def test_checksum_mismatch_discards_the_part(server, tmp_path):
+    dest = tmp_path / "kaikki.jsonl"
+    assert download(server, dest, sha256="0" * 64) is DownloadStatus.FAILED
+    assert not dest.exists()
+    assert leftover_parts(dest) == []
+
+    digest = hashlib.sha256(server.body).hexdigest()
+    assert download(server, dest, sha256=digest) is DownloadStatus.DOWNLOADED
+    assert dest.with_name("kaikki.jsonl.sha256").read_text().split()[0] == digest
@@ -0,0 +1,76 @@
+import json
+import sqlite3
+
+import pytest
+
+from app.utils.convert_fi_jsonl_to_sqlite import (
+    TAG_MASK_BITS,
+    TagDictionary,
+    find_forms_by_tags,
+    init_database,
+    insert_forms,
+)
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    init_database(connection)
+    connection.execute(
+        "INSERT INTO entries_base (id, word, pos) VALUES (1, 'talo', 'noun')"
+    )
+    yield connection
+    connection.close()
+
+
+def stored_tags(connection, tag_lists):
+    tags = TagDictionary(connection)
+    cursor = connection.cursor()
+    insert_forms(
+        cursor,
+        1,
+        [
+            (f"form{number}", tuple(form_tags), None)
+            for number, form_tags in enumerate(tag_lists)
+        ],
+        tags,
+    )
+    rows = connection.execute("SELECT tags_json FROM forms_with_tags ORDER BY id")
+    return [json.loads(value) if value is not None else None for (value,) in rows]
+
+
+@pytest.mark.parametrize(
+    "tags",
+    [
+        ["inessive", "singular"],
+        ["singular", "inessive"],
+        ["present", "indicative", "first-person", "singular"],
+        ["plural", "plural"],
+        ["rare-tag", "nominative", "rare-tag"],
+    ],
+)
+def test_view_returns_tags_in_source_order(connection, tags):
+    assert stored_tags(connection, [tags]) == [tags]
+
+
+def test_forms_without_tags_have_null_tags(connection):
+    assert stored_tags(connection, [[]]) == [None]
+
+
+def test_order_is_stored_only_when_tags_are_not_sorted(connection):
+    stored_tags(connection, [["inessive", "singular"], ["singular", "inessive"]])
+    orders = [
+        order
+        for (order,) in connection.execute("SELECT tag_order FROM forms ORDER BY id")
+    ]
+    assert orders[0] is None
+    assert orders[1] is not None
+
+
+def test_overflow_tags_keep_their_order(connection):
+    rare = [f"rare{number:02d}" for number in range(TAG_MASK_BITS)]
+    tag_lists = [rare, ["singular", rare[-1], "genitive", rare[-2]]]
+    assert stored_tags(connection, tag_lists) == tag_lists
+    assert find_forms_by_tags(connection, ["genitive", rare[-1], rare[-2]]) == [
+        (1, "form1")
+    ]
@@ -0,0 +1,109 @@
+import gc
+import sqlite3
+
+import pytest
+
+from app.utils import convert_fi_jsonl_to_sqlite as converter
+from app.utils import dictionary_downloader as downloader
+from app.utils.import_checkpoint import load_checkpoint
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(monkeypatch, module, checkpoints):
+    """Make ``module`` fail while saving its checkpoint number ``checkpoints + 1``."""
+    save_checkpoint = module.save_checkpoint
+    saved = 0
+
+    def save(*args, **kwargs):
+        nonlocal saved
+        if saved == checkpoints:
+            raise Interrupted
+        saved += 1
+        save_checkpoint(*args, **kwargs)
+
+    monkeypatch.setattr(module, "save_checkpoint", save)
+
+
+def table_counts(path, tables):
+    connection = sqlite3.connect(path)
+    try:
+        return {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in tables
+        }
+    finally:
+        connection.close()
+
+
+def convert(source, output, checkpoint_connection=None):
+    connection = checkpoint_connection or sqlite3.connect(output)
+    try:
+        checkpoint = None
+        if checkpoint_connection is None:
+            converter.init_database(connection)
+        else:
+            checkpoint = load_checkpoint(connection, source)
+        return converter.process_entries(
+            source, connection, chunk_size=50, checkpoint=checkpoint
+        )
+    finally:
+        connection.close()
+
+
+CONVERTER_TABLES = ["entries_base", "senses_base", "forms", "strings"]
+DOWNLOADER_TABLES = ["words", "translations", "word_forms", "noun_declensions"]
+
+
+def test_converter_resumes_from_its_checkpoint(synthetic_dump, tmp_path):
+    expected = convert(synthetic_dump, tmp_path / "full.sqlite")
+    with pytest.MonkeyPatch.context() as patch:
+        interrupt_after(patch, converter, 2)
+        with pytest.raises(Interrupted):
+            convert(synthetic_dump, tmp_path / "resumed.sqlite")
+    gc.collect()
+
+    connection = sqlite3.connect(tmp_path / "resumed.sqlite")
+    checkpoint = load_checkpoint(connection, synthetic_dump)
+    assert checkpoint is not None and not checkpoint.completed
+    assert 0 < checkpoint.byte_offset < synthetic_dump.stat().st_size
+
+    assert convert(synthetic_dump, None, connection) == expected
+    assert table_counts(tmp_path / "resumed.sqlite", CONVERTER_TABLES) == (
+        table_counts(tmp_path / "full.sqlite", CONVERTER_TABLES)
+    )
+
+
+def import_dump(monkeypatch, source, db_file, resume=False):
+    monkeypatch.setattr(downloader, "DB_FILE", db_file)
+    downloader.import_to_sqlite(
+        batch_size=200, resume=resume, progress=None, source=source
+    )
+
+
+def test_downloader_resumes_from_its_checkpoint(synthetic_dump, tmp_path, monkeypatch):
+    import_dump(monkeypatch, synthetic_dump, tmp_path / "full.db")
+    with pytest.MonkeyPatch.context() as patch:
+        interrupt_after(patch, downloader, 2)
+        with pytest.raises(Interrupted):
+            import_dump(patch, synthetic_dump, tmp_path / "resumed.db")
+    gc.collect()
+    assert not (tmp_path / "resumed.db").exists()
+    build = sqlite3.connect(downloader._build_path(tmp_path / "resumed.db"))
+    checkpoint = load_checkpoint(build, synthetic_dump)
+    build.close()
+    assert 0 < checkpoint.byte_offset < synthetic_dump.stat().st_size
+
+    import_dump(monkeypatch, synthetic_dump, tmp_path / "resumed.db", resume=True)
+    assert table_counts(tmp_path / "resumed.db", DOWNLOADER_TABLES) == (
+        table_counts(tmp_path / "full.db", DOWNLOADER_TABLES)
+    )
+    assert downloader._completed_import(synthetic_dump, tmp_path / "resumed.db")
+
+
+def test_completed_import_is_not_repeated(synthetic_dump, tmp_path, monkeypatch):
+    import_dump(monkeypatch, synthetic_dump, tmp_path / "dictionary.db")
+    interrupt_after(monkeypatch, downloader, 0)
+    import_dump(monkeypatch, synthetic_dump, tmp_path / "dictionary.db", resume=True)
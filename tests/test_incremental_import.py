@@ -0,0 +1,97 @@
+import json
+import sqlite3
+import sys
+
+import pytest
+
+from app.utils import convert_fi_jsonl_to_sqlite as converter
+
+
+def run_converter(monkeypatch, source, output, *options):
+    monkeypatch.setattr(
+        sys, "argv", ["convert", str(source), str(output), "--quiet", *options]
+    )
+    converter.main()
+
+
+def snapshot(path):
+    """Entries with their sense and form counts, independent of row ids."""
+    connection = sqlite3.connect(path)
+    try:
+        return sorted(
+            connection.execute(
+                """
+                SELECT
+                    word,
+                    pos,
+                    content_hash,
+                    (SELECT COUNT(*) FROM senses_base WHERE entry_id = e.id),
+                    (SELECT COUNT(*) FROM forms WHERE entry_id = e.id)
+                FROM entries_base AS e
+                """
+            )
+        )
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def next_dump(synthetic_dump, tmp_path):
+    """The synthetic dump with entries dropped, changed and added."""
+    lines = synthetic_dump.read_bytes().splitlines(keepends=True)
+    targets = [
+        number
+        for number, line in enumerate(lines)
+        if converter.is_target_entry(json.loads(line))
+    ]
+    dropped = set(targets[:5])
+    changed = json.loads(lines[targets[5]])
+    changed["senses"][0]["glosses"].append("a new meaning")
+    lines[targets[5]] = (json.dumps(changed, ensure_ascii=False) + "\n").encode()
+    added = [
+        lines[number].replace(b'"word": "', b'"word": "uusi') for number in targets[6:9]
+    ]
+    path = tmp_path / "next.jsonl"
+    path.write_bytes(
+        b"".join(line for number, line in enumerate(lines) if number not in dropped)
+        + b"".join(added)
+    )
+    return path
+
+
+def test_incremental_run_applies_the_delta(
+    synthetic_dump, next_dump, tmp_path, monkeypatch
+):
+    run_converter(monkeypatch, synthetic_dump, tmp_path / "updated.sqlite")
+    run_converter(monkeypatch, next_dump, tmp_path / "updated.sqlite", "--incremental")
+    run_converter(monkeypatch, next_dump, tmp_path / "full.sqlite")
+    assert snapshot(tmp_path / "updated.sqlite") == snapshot(tmp_path / "full.sqlite")
+
+
+@pytest.mark.parametrize("existing", [None, b""])
+def test_first_incremental_run_builds_the_database(
+    synthetic_dump, tmp_path, monkeypatch, existing
+):
+    output = tmp_path / "first.sqlite"
+    if existing is not None:
+        output.write_bytes(existing)
+    run_converter(monkeypatch, synthetic_dump, output, "--incremental")
+    run_converter(monkeypatch, synthetic_dump, tmp_path / "full.sqlite")
+    assert snapshot(output) == snapshot(tmp_path / "full.sqlite")
+    assert snapshot(output)
+
+
+def test_incremental_run_rejects_an_older_schema(synthetic_dump, tmp_path, monkeypatch):
+    output = tmp_path / "old.sqlite"
+    connection = sqlite3.connect(output)
+    connection.execute(
+        "CREATE TABLE entries (id INTEGER PRIMARY KEY, word TEXT, content_hash TEXT)"
+    )
+    connection.commit()
+    connection.close()
+    before = output.read_bytes()
+
+    with pytest.raises(ValueError, match="older schema"):
+        run_converter(monkeypatch, synthetic_dump, output, "--incremental")
+    assert output.read_bytes() == before
+    assert not output.with_name(output.name + "-wal").exists()
@@ -0,0 +1,69 @@
+import asyncio
+import json
+from collections import defaultdict
+
+import pytest
+
+from app.utils import dictionary_downloader as downloader
+
+
+def analyses(results):
+    return {(result["word"], tuple(result["tags"])) for result in results}
+
+
+def test_every_form_resolves_to_its_lemmas(lookups, imported_entries):
+    expected = defaultdict(set)
+    for entry in imported_entries:
+        for form, tags in downloader._surface_forms(entry.get("forms", [])):
+            expected[form].add((entry["word"], tuple(tags.split())))
+    assert expected
+    for form, lemmas in expected.items():
+        assert analyses(lookups.resolve_form(form)) == lemmas
+
+
+def test_lemmas_and_unknown_words_do_not_resolve(lookups, imported_entries):
+    assert lookups.resolve_form(imported_entries[0]["word"]) == []
+    assert lookups.resolve_form("xyzzy") == []
+
+
+def test_async_resolution_matches_sync(lookups, imported_entries):
+    form = imported_entries[0]["forms"][0]["form"]
+    assert asyncio.run(lookups.resolve_form_async(form)) == lookups.resolve_form(form)
+
+
+@pytest.fixture
+def shared_form_dump(tmp_path):
+    """Two nouns that share the inflected form "kuusen"."""
+    entries = [
+        {
+            "word": word,
+            "pos": "noun",
+            "lang": "Finnish",
+            "lang_code": "fi",
+            "senses": [{"glosses": [gloss]}],
+            "forms": [{"form": "kuusen", "tags": ["genitive", "singular"]}],
+        }
+        for word, gloss in (("kuusi", "six"), ("kuusi2", "spruce"))
+    ]
+    path = tmp_path / "shared.jsonl"
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+    return path
+
+
+@pytest.mark.parametrize(
+    "frequency_list, expected",
+    [(None, ["kuusi", "kuusi2"]), ("kuusi2 100\nkuusi 40\n", ["kuusi2", "kuusi"])],
+)
+def test_shared_forms_follow_the_frequency_list(
+    shared_form_dump, tmp_path, monkeypatch, lookups, frequency_list, expected
+):
+    db_file = tmp_path / "finnish_dictionary.db"
+    monkeypatch.setattr(downloader, "DB_FILE", db_file)
+    monkeypatch.setattr(lookups, "DB_FILE", db_file)
+    if frequency_list is not None:
+        (tmp_path / "frequencies.txt").write_text(frequency_list)
+        frequency_list = tmp_path / "frequencies.txt"
+    downloader.import_to_sqlite(
+        progress=None, source=shared_form_dump, frequency_list=frequency_list
+    )
+    assert [result["word"] for result in lookups.resolve_form("kuusen")] == expected
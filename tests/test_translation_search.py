@@ -0,0 +1,92 @@
+import asyncio
+import re
+import shutil
+import sqlite3
+
+import pytest
+
+
+def expected_words(entries, *tokens):
+    """Words with a gloss containing every token."""
+    return {
+        entry["word"]
+        for entry in entries
+        for sense in entry.get("senses", [])
+        for gloss in sense.get("glosses", [])
+        if set(tokens) <= set(re.findall(r"\w+", gloss.lower()))
+    }
+
+
+def search_all(lookups, query):
+    return lookups.search_by_translation(query, limit=10_000)
+
+
+@pytest.mark.parametrize("query", ["stone", "tree bird", "Water  HOUSE"])
+def test_search_finds_every_word_with_a_matching_gloss(
+    lookups, imported_entries, query
+):
+    tokens = query.lower().split()
+    matches = search_all(lookups, query)
+    assert matches
+    assert {match["word"] for match in matches} == expected_words(
+        imported_entries, *tokens
+    )
+    for match in matches:
+        assert set(tokens) <= set(match["translation"].lower().split())
+
+
+def test_closest_translation_ranks_first(lookups, imported_entries):
+    assert "stone" in {
+        gloss
+        for entry in imported_entries
+        for sense in entry["senses"]
+        for gloss in sense["glosses"]
+    }
+    assert lookups.search_by_translation("stone", limit=1)[0]["translation"] == "stone"
+
+
+def test_pages_follow_on_from_each_other(lookups):
+    matches = search_all(lookups, "water")
+    pages = [
+        lookups.search_by_translation("water", limit=7, offset=offset)
+        for offset in range(0, len(matches), 7)
+    ]
+    assert [match for page in pages for match in page] == matches
+
+
+@pytest.mark.parametrize(
+    "query, same_as",
+    [('"stone"', "stone"), ("stone*", "stone"), ("tree OR", "tree or"), ("()", "")],
+)
+def test_query_syntax_is_taken_literally(lookups, query, same_as):
+    assert search_all(lookups, query) == search_all(lookups, same_as)
+
+
+def test_inflected_query_matches_by_stem(lookups):
+    assert search_all(lookups, "speaking") == search_all(lookups, "speak")
+    assert search_all(lookups, "speak")
+
+
+def test_async_search_matches_sync(lookups):
+    assert asyncio.run(lookups.search_by_translation_async("bird", 5)) == (
+        lookups.search_by_translation("bird", 5)
+    )
+
+
+def test_new_translations_are_searchable(dictionary_db, tmp_path, monkeypatch, lookups):
+    db_file = tmp_path / "finnish_dictionary.db"
+    shutil.copy(dictionary_db, db_file)
+    connection = sqlite3.connect(db_file)
+    word_id, word = connection.execute("SELECT id, word FROM words LIMIT 1").fetchone()
+    connection.execute(
+        "INSERT INTO translations (word_id, language_code, translation, definition) "
+        "VALUES (?, 'en', 'lighthouse keeper', 'lighthouse keeper')",
+        (word_id,),
+    )
+    connection.commit()
+    connection.close()
+
+    monkeypatch.setattr(lookups, "DB_FILE", db_file)
+    [match] = lookups.search_by_translation("lighthouse")
+    assert match["word"] == word
+    assert match["translation"] == "lighthouse keeper"